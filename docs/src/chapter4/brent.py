@@ -0,0 +1,116 @@
+"""
+Brent's method, which combines the guaranteed convergence of the
+bisection method with the fast convergence of the secant method
+and inverse quadratic interpolation. The function values at the
+bracket end points are stored, so every iteration costs exactly
+one evaluation of f. The solver also records a trace of the
+iterations, to study the observed convergence rate.
+"""
+from math import exp, log
+from statistics import median
+
+def convergence_rate(x):
+    """
+    Estimate the convergence order q from a list of iterates, using
+    q = ln(e[k+1]/e[k])/ln(e[k]/e[k-1]), with e[k] = |x[k+1] - x[k]|.
+    """
+    e = [abs(x[k+1] - x[k]) for k in range(len(x)-1)]
+    q = []
+    for k in range(1, len(e)-1):
+        if e[k+1] > 0 and e[k] > 0 and e[k-1] > 0 and e[k] != e[k-1]:
+            q.append(log(e[k+1]/e[k])/log(e[k]/e[k-1]))
+    return q
+
+def brent(f, a, b, tol=1e-12, max_it=100):
+    fa, fb = f(a), f(b)
+    f_calls = 2
+    if fa*fb > 0:
+        raise ValueError(f'No roots or more than one root in [{a},{b}]')
+
+    # b is the current approximation, the root is between b and c,
+    # and a is the previous value of b
+    c, fc = b, fb
+    x = [b]
+    n_full = None           # number of iterates before the first tol1 step
+    iter = 0
+    converged = False
+    while iter <= max_it:
+        if fb*fc > 0:
+            c, fc = a, fa                 # restore the bracket [b, c]
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b             # make b the best approximation
+            fa, fb, fc = fb, fc, fb
+        tol1 = 2*2.2e-16*abs(b) + tol/2
+        m = (c - b)/2
+        if abs(m) <= tol1 or fb == 0:
+            converged = True
+            break
+        if iter == max_it:
+            break
+
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb/fa
+            if a == c:                    # secant step
+                p = 2*m*s
+                q = 1 - s
+            else:                         # inverse quadratic interpolation
+                q = fa/fc
+                r = fb/fc
+                p = s*(2*m*q*(q - r) - (b - a)*(r - 1))
+                q = (q - 1)*(r - 1)*(s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            # accept the step only if it stays well inside the bracket
+            # and is smaller than half the step before the last one
+            if 2*p < min(3*m*q - abs(tol1*q), abs(e*q)):
+                e, d = d, p/q
+            else:
+                d = e = m                 # bisection
+        else:
+            d = e = m                     # bisection
+        a, fa = b, fb
+        if abs(d) > tol1:
+            b += d
+        else:
+            # step limited by the tolerance, which says nothing about
+            # the convergence rate
+            b += tol1 if m > 0 else -tol1
+            if n_full is None:
+                n_full = len(x)
+        fb = f(b)
+        f_calls += 1
+        x.append(b)
+        iter += 1
+
+    # the order is estimated from the steps not limited by tol1
+    q = convergence_rate(x[:n_full])
+    trace = {'iterations': iter, 'f_calls': f_calls, 'x': x,
+             'orders': q, 'order': median(q) if q else None}
+    return b, converged, trace
+
+def test_brent():
+    f_calls = []
+    def f(x):
+        f_calls.append(x)
+        return x**3 - 2*x - 5
+    sol, converged, trace = brent(f, 2, 3, tol=1e-14)
+    assert converged and abs(sol - 2.0945514815423265) < 1e-14
+    # one f call per iteration, plus the two end points
+    assert trace['f_calls'] == len(f_calls) == trace['iterations'] + 2
+    assert trace['iterations'] < 10
+    # superlinear convergence at a simple root
+    assert trace['order'] > 1
+
+
+if __name__ == '__main__':
+    test_brent()
+
+    #call the method for f(x)= x**2-4*x+exp(-x), as for bisection
+    f = lambda x: x**2-4*x+exp(-x)
+    sol, converged, trace = brent(f, -0.5, 1)
+    print(f'x = {sol:g} is an approximate root, f({sol:g}) = {f(sol):g}')
+    print(f'{trace["iterations"]} iterations, {trace["f_calls"]} f calls')
+    print(f'observed convergence rates: {trace["orders"]}')
+    print(f'estimated order: {trace["order"]:g}')
@@ -0,0 +1,109 @@
+"""
+Vectorized versions of Newton's method (Newton2.py) and the
+bisection method (bisection.py), which solve many independent
+root finding problems at once. All problems are iterated in
+lockstep with array operations, and problems that have converged
+are removed from the arrays of active problems.
+
+The problems are given by arrays of starting points (or brackets),
+and/or by a family f(x, *args), where the arrays in args hold one
+parameter value per problem. All arrays are broadcast to a common
+shape, and the functions return arrays of this shape with the
+roots, a flag telling if each problem converged, and the number of
+iterations used.
+"""
+import numpy as np
+
+def broadcast_problems(*arrays):
+    shape = np.broadcast_shapes(*[np.shape(a) for a in arrays])
+    flat = [np.broadcast_to(a, shape).ravel() for a in arrays]
+    return shape, flat
+
+def Newton_vec(f, dfdx, x0, args=(), max_it=20, tol=1e-3):
+    shape, (x, *args) = broadcast_problems(x0, *args)
+    x = x.astype(float)   # copy, since we update x in-place
+    converged = np.zeros(x.size, dtype=bool)
+    iters = np.zeros(x.size, dtype=int)
+
+    active = np.arange(x.size)  # indices of unconverged problems
+    f0 = f(x, *args)
+    for it in range(max_it + 1):
+        done = np.abs(f0) <= tol
+        converged[active[done]] = True
+        active, f0 = active[~done], f0[~done]
+        if len(active) == 0 or it == max_it:
+            break
+        args_a = [a[active] for a in args]
+        x_a = x[active] - f0/dfdx(x[active], *args_a)
+        x[active] = x_a
+        iters[active] += 1
+        f0 = f(x_a, *args_a)
+    return x.reshape(shape), converged.reshape(shape), iters.reshape(shape)
+
+def bisection_vec(f, a, b, args=(), max_it=100, tol=1e-3):
+    shape, (a, b, *args) = broadcast_problems(a, b, *args)
+    a, b = a.astype(float), b.astype(float)
+    fa = f(a, *args)
+    # problems without a sign change in [a, b] are not solved:
+    valid = fa*f(b, *args) <= 0
+    m = np.full(a.size, np.nan)
+    m[valid] = (a[valid] + b[valid])/2
+    converged = np.zeros(a.size, dtype=bool)
+    iters = np.zeros(a.size, dtype=int)
+
+    active = np.flatnonzero(valid)
+    a, b, fa = a[active], b[active], fa[active]
+    args = [arg[active] for arg in args]
+    fm = f(m[active], *args)
+    for it in range(max_it + 1):
+        done = np.abs(fm) <= tol
+        converged[active[done]] = True
+        keep = ~done
+        active, a, b, fa, fm = active[keep], a[keep], b[keep], fa[keep], fm[keep]
+        args = [arg[keep] for arg in args]
+        if len(active) == 0 or it == max_it:
+            break
+        left = fa*fm < 0     # root in [a, m]
+        m_a = m[active]
+        b = np.where(left, m_a, b)
+        a = np.where(left, a, m_a)
+        fa = np.where(left, fa, fm)   # f(a) is reused, not recomputed
+        m_a = (a + b)/2
+        m[active] = m_a
+        iters[active] += 1
+        fm = f(m_a, *args)
+    return m.reshape(shape), converged.reshape(shape), iters.reshape(shape)
+
+def test_root_finding_vec():
+    # roots of x**2 - c for many values of c
+    c = np.linspace(1, 100, 1000)
+    f = lambda x, c: x**2 - c
+    dfdx = lambda x, c: 2*x
+    tol = 1e-10
+
+    x, converged, iters = Newton_vec(f, dfdx, 1.0, args=(c,), tol=tol)
+    assert converged.all()
+    assert np.abs(x - np.sqrt(c)).max() < 1e-10
+    x, converged, iters = bisection_vec(f, 0, 11, args=(c,), tol=tol)
+    assert converged.all()
+    assert np.abs(x - np.sqrt(c)).max() < 1e-10
+    # no sign change for c < 0:
+    x, converged, iters = bisection_vec(f, 0, 11, args=(-1.0,))
+    assert not converged and np.isnan(x)
+
+
+if __name__ == '__main__':
+    from numpy import exp
+
+    test_root_finding_vec()
+
+    #the same f as in Newton2.py, from many starting points
+    f = lambda x: x**2-4*x+exp(-x)
+    dfdx = lambda x: 2*x-4-exp(-x)
+    x0 = np.linspace(-1, 5, 7)
+    sol, converged, iters = Newton_vec(f, dfdx, x0, tol=1e-6)
+    for x0_, x_, c_, i_ in zip(x0, sol, converged, iters):
+        print(f'x0={x0_:5.2f}: x={x_:g}, converged={c_}, {i_} iterations')
+
+    sol, converged, iters = bisection_vec(f, [-0.5, 3], [1, 5], tol=1e-6)
+    print(f'Bisection: x={sol}, iterations={iters}')
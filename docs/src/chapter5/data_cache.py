@@ -0,0 +1,95 @@
+"""
+Cache for data parsed from text files. The parsed data is stored as
+a binary .npy file, together with the modification time and size
+of the text file. The next time the same file is loaded, the .npy
+file is memory-mapped instead of parsing the text again, which is
+fast and does not copy the data into memory. If the text file has
+changed, it is parsed again and the cache is updated.
+"""
+import json
+import os
+import numpy as np
+
+def cached_load(filename, parse=np.loadtxt, name=None, cache_dir=None):
+    """
+    Return parse(filename) as a (read-only, memory-mapped) array.
+    The array must have a fixed-size dtype, for instance a structured
+    dtype with strings of fixed length, not Python objects. name
+    separates caches of the same file made with different parse
+    functions (default: module and name of parse, for instance
+    numpy.loadtxt). It must be given if parse is a lambda or a local
+    function, since these have no unique name. The cache is stored
+    in cache_dir, by default __datacache__ next to the file.
+    """
+    path = os.path.abspath(filename)
+    status = os.stat(path)
+    source = {'path': path, 'mtime_ns': status.st_mtime_ns,
+              'size': status.st_size}
+    if name is None:
+        name = f'{parse.__module__}.{parse.__qualname__}'
+        if '<' in name:
+            raise ValueError(f'give a name for the cache of {name}')
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(path), '__datacache__')
+    stem = os.path.join(cache_dir, f'{os.path.basename(path)}.{name}')
+    npy_file, info_file = stem + '.npy', stem + '.json'
+
+    try:
+        with open(info_file, 'r') as infile:
+            if json.load(infile) == source:
+                return np.load(npy_file, mmap_mode='r')
+    except (OSError, ValueError):
+        pass   # no cache, or a damaged one
+
+    data = np.asarray(parse(filename))
+    if data.dtype.hasobject:
+        raise ValueError(f'{name} returned Python objects, which '
+                         'cannot be memory-mapped')
+    os.makedirs(cache_dir, exist_ok=True)
+    # write to temporary files first, so a crash never leaves a
+    # cache that looks valid but is incomplete
+    with open(npy_file + '.tmp', 'wb') as outfile:
+        np.save(outfile, data)
+    os.replace(npy_file + '.tmp', npy_file)
+    with open(info_file + '.tmp', 'w') as outfile:
+        json.dump(source, outfile)
+    os.replace(info_file + '.tmp', info_file)
+    return np.load(npy_file, mmap_mode='r')
+
+def parse_rainfall(filename):
+    """rainfall.txt as a structured array, without the 'Year' row."""
+    data = np.loadtxt(filename, skiprows=1,
+                      dtype=[('month', 'U4'), ('rainfall', float)])
+    return data[:-1]
+
+def parse_cities(filename):
+    """
+    cities.txt (chapter 7) as a structured array, with the same data
+    as the dict of dicts in read_cities_join.py.
+    """
+    return np.loadtxt(filename, dtype=[('city', 'U40'), ('country', 'U40'),
+                                       ('lat', float), ('long', float),
+                                       ('pop', np.int64)])
+
+def parse_deg2(filename):
+    """deg2.txt (chapter 7) as a structured array, as in read_deg_dict.py."""
+    return np.loadtxt(filename, dtype=[('city', 'U40'), ('temp', float)],
+                      converters={0: lambda s: s.rstrip(':')})
+
+
+if __name__ == '__main__':
+    data = cached_load('data.txt')
+    print(f'The mean value is {data.mean()}')
+
+    rainfall = cached_load('rainfall.txt', parse_rainfall)
+    for month, value in rainfall:
+        print(month, value)
+    print(type(rainfall), rainfall['rainfall'].mean())
+
+    # dicts are Python objects and cannot be cached, but the same data
+    # as structured arrays can, and the dicts are easily rebuilt:
+    cities = cached_load('../chapter7/cities.txt', parse_cities)
+    print({f'{c}, {n}': {'lat': lat, 'long': long, 'pop': pop}
+           for c, n, lat, long, pop in cities.tolist()})
+    temps = cached_load('../chapter7/deg2.txt', parse_deg2)
+    print(dict(temps.tolist()))
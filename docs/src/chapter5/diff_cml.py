@@ -1,13 +1,8 @@
-from math import *
 import sys
+from formula_compile import compile_formula
 
 formula = sys.argv[1]
-code = f"""
-def f(x):
-    return {formula}
-"""
-
-exec(code)
+f = compile_formula(formula)
 x = float(sys.argv[2])
 
 def numerical_derivative(f, x, h=1E-5):
@@ -0,0 +1,69 @@
+"""
+Vectorized versions of the functions in interest.py. All arguments
+can be NumPy arrays, which are broadcast against each other, so a
+whole grid of (P, r, n) scenarios is computed in one call.
+"""
+import numpy as np
+
+def present_amount(P, r, n):
+    return P*np.power(1 + np.asarray(r)/100, n)
+
+def initial_amount(A, r, n):
+    return A*np.power(1 + np.asarray(r)/100, np.negative(n))
+
+def years(P, A, r):
+    # log1p(r/100) is more accurate than log(1 + r/100) for small r
+    return np.log(np.divide(A, P))/np.log1p(np.asarray(r)/100)
+
+def annual_rate(P, A, n):
+    return 100*np.expm1(np.log(np.divide(A, P))/n)
+
+def growth_table(P, r, N):
+    """
+    Return the amounts after n = 0, 1, ..., N years, as an array with
+    the year along the last axis, for all (P, r) in the broadcast
+    grid. The table is built by a cumulative product of the yearly
+    growth factor, instead of computing (1 + r/100)**n for every n.
+    """
+    factor = 1 + np.asarray(r, dtype=float)[..., np.newaxis]/100
+    factors = np.broadcast_to(factor, factor.shape[:-1] + (N,))
+    table = np.ones(factor.shape[:-1] + (N + 1,))
+    np.cumprod(factors, axis=-1, out=table[..., 1:])
+    return np.asarray(P, dtype=float)[..., np.newaxis]*table
+
+def growth_table_error(P, r, N):
+    """
+    Return the maximum relative deviation between growth_table and
+    the amounts computed with present_amount. The cumulative product
+    accumulates one rounding error per year, so the deviation grows
+    roughly like N times the machine precision.
+    """
+    table = growth_table(P, r, N)
+    exact = present_amount(np.asarray(P, dtype=float)[..., np.newaxis],
+                           np.asarray(r, dtype=float)[..., np.newaxis],
+                           np.arange(N + 1))
+    return np.max(np.abs(table - exact)/np.abs(exact))
+
+def test_all_functions():
+    # the same values as in interest.py, on a grid of rates
+    A = 2.31525; P = 2.0; r = 5.0; n = 3
+    r_grid = np.array([r, r, r])
+    assert np.allclose(present_amount(P, r_grid, n), A, rtol=0, atol=1E-12)
+    assert np.allclose(initial_amount(A, r_grid, n), P, rtol=0, atol=1E-12)
+    assert np.allclose(years(P, A, r_grid), n, rtol=0, atol=1E-12)
+    assert np.allclose(annual_rate(P, [A, A], n), r, rtol=0, atol=1E-12)
+
+    table = growth_table([100.0, 200.0], [[2.5], [5.0]], 10)
+    assert table.shape == (2, 2, 11)
+    assert growth_table_error([100.0, 200.0], [[2.5], [5.0]], 10) < 1E-14
+
+if __name__ == '__main__':
+    test_all_functions()
+
+    # the tables from list_comprehension.py in chapter 3
+    print(growth_table(100, [2.5, 5.0], 10))
+    # a grid of 100 initial amounts, 100 rates and 30 years
+    P = np.linspace(100, 1000, 100)[:, np.newaxis]
+    r = np.linspace(0.5, 10, 100)
+    print(growth_table(P, r, 30).shape,
+          f'relative deviation from pow: {growth_table_error(P, r, 30):g}')
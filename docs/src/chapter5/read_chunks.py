@@ -0,0 +1,108 @@
+"""
+Reading large files of numbers in columns, like data.txt and
+rainfall.txt, without keeping the whole file in memory. The file
+is read in chunks of a fixed number of lines, each chunk is turned
+into a NumPy array, and statistics are updated chunk by chunk.
+"""
+from collections import deque
+from itertools import islice
+import numpy as np
+
+class ChunkReader:
+    """
+    Iterate over the data in a file as NumPy arrays of (at most)
+    chunk_lines rows. usecols selects the columns to read, as for
+    np.loadtxt; columns with text, like the month names in
+    rainfall.txt, must be left out. The first skip_header and the
+    last skip_footer lines are not parsed, but are available as
+    lists of strings in the attributes header and footer after
+    the iteration.
+    """
+    def __init__(self, filename, usecols=None, skip_header=0,
+                 skip_footer=0, chunk_lines=100000):
+        self.filename, self.usecols = filename, usecols
+        self.skip_header, self.skip_footer = skip_header, skip_footer
+        self.chunk_lines = chunk_lines
+        self.header, self.footer = [], []
+
+    def parse(self, lines):
+        data = np.loadtxt(lines, usecols=self.usecols, ndmin=2)
+        if data.shape[1] == 1:
+            data = data[:, 0]    # one column gives a 1D array
+        return data
+
+    def __iter__(self):
+        with open(self.filename, 'r') as infile:
+            self.header = list(islice(infile, self.skip_header))
+            # the last lines read are held back, since they may be the footer
+            last = deque()
+            while True:
+                lines = list(islice(infile, self.chunk_lines))
+                if not lines:
+                    break
+                last.extend(lines)
+                n = len(last) - self.skip_footer
+                lines = [last.popleft() for i in range(max(n, 0))]
+                if lines:
+                    yield self.parse(lines)
+            self.footer = list(last)
+
+
+class RunningStats:
+    """
+    Mean, variance, min and max of the data seen so far, updated
+    one chunk at a time with Welford's algorithm (in the version
+    for combining the statistics of two sets). For 2D chunks, the
+    statistics are computed for each column.
+    """
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.M2 = 0.0      # sum of squared deviations from the mean
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, data):
+        data = np.asarray(data, dtype=float)
+        n_chunk = len(data)
+        if n_chunk == 0:
+            return
+        mean_chunk = data.mean(axis=0)
+        M2_chunk = ((data - mean_chunk)**2).sum(axis=0)
+        delta = mean_chunk - self.mean
+        n = self.n + n_chunk
+        self.mean = self.mean + delta*n_chunk/n
+        self.M2 = self.M2 + M2_chunk + delta**2*self.n*n_chunk/n
+        self.n = n
+        self.min = np.minimum(self.min, data.min(axis=0))
+        self.max = np.maximum(self.max, data.max(axis=0))
+
+    def variance(self, ddof=0):
+        return self.M2/(self.n - ddof)
+
+    def __str__(self):
+        return (f'n={self.n}, mean={self.mean}, variance={self.variance()}, '
+                f'min={self.min}, max={self.max}')
+
+def file_stats(filename, **kwargs):
+    """Return RunningStats for a file, arguments as for ChunkReader."""
+    stats = RunningStats()
+    for chunk in ChunkReader(filename, **kwargs):
+        stats.update(chunk)
+    return stats
+
+
+if __name__ == '__main__':
+    # the same mean value as computed in read_data.py
+    print(file_stats('data.txt', chunk_lines=4))
+
+    # rainfall.txt has one header line, and the annual
+    # average on the last line (starting with 'Year')
+    reader = ChunkReader('rainfall.txt', usecols=1, skip_header=1,
+                         skip_footer=1)
+    stats = RunningStats()
+    for chunk in reader:
+        stats.update(chunk)
+    annual_avg = float(reader.footer[0].split()[1])
+    print(f'Monthly rainfall: {stats}')
+    print('The average rainfall for the year:', annual_avg)
@@ -0,0 +1,49 @@
+import os
+import tempfile
+import numpy as np
+from data_cache import cached_load, parse_rainfall
+
+def double(filename):
+    return 2*np.loadtxt(filename)
+
+def test_parsers():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'data.txt')
+        np.savetxt(filename, [1.0, 2.0, 3.0])
+        # two parsers of the same file have separate caches
+        assert cached_load(filename).tolist() == [1, 2, 3]
+        assert cached_load(filename, double).tolist() == [2, 4, 6]
+        assert cached_load(filename).tolist() == [1, 2, 3]
+        assert cached_load(filename, lambda f: 10*np.loadtxt(f),
+                           name='ten').tolist() == [10, 20, 30]
+        # lambdas have no unique name
+        try:
+            cached_load(filename, lambda f: 100*np.loadtxt(f))
+        except ValueError:
+            pass
+        else:
+            raise AssertionError('lambda without name was accepted')
+
+def test_changed_file():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'data.txt')
+        np.savetxt(filename, [1.0, 2.0])
+        os.utime(filename, ns=(10**18, 10**18))
+        assert cached_load(filename).tolist() == [1, 2]
+        # same size, new modification time
+        np.savetxt(filename, [5.0, 6.0])
+        os.utime(filename, ns=(2*10**18, 2*10**18))
+        assert cached_load(filename).tolist() == [5, 6]
+        # cache is used when the file is unchanged
+        assert isinstance(cached_load(filename), np.memmap)
+
+def test_rainfall():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(os.path.dirname(__file__), 'rainfall.txt')
+        rainfall = cached_load(filename, parse_rainfall,
+                               cache_dir=tmpdir)
+        assert len(rainfall) == 12 and rainfall['month'][0] == 'Jan'
+
+test_parsers()
+test_changed_file()
+test_rainfall()
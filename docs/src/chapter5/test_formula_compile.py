@@ -0,0 +1,63 @@
+from math import sin, exp, pi
+import numpy as np
+from formula_compile import compile_formula, function_names
+
+def test_accepted():
+    f = compile_formula('sin(x)*exp(-x**2) + 3*x - 1')
+    assert abs(f(0.5) - (sin(0.5)*exp(-0.25) + 0.5)) < 1E-14
+    x = np.linspace(0, 1, 5)
+    expected = np.sin(x)*np.exp(-x**2) + 3*x - 1
+    assert np.abs(f(x) - expected).max() < 1E-14
+    g = compile_formula('-a*x**2 + abs(b) // 2 % 3', variables=('x', 'a', 'b'))
+    assert g(2, 1, -5) == -4 + 2
+    assert compile_formula('pi/2', variables=())() == pi/2
+    # compiled formulas are cached
+    assert compile_formula('sin(x)*exp(-x**2) + 3*x - 1') is f
+
+def test_scalar_vector():
+    # the math and numpy versions of each function give the same result
+    x = np.linspace(0.1, 0.9, 9)
+    formulas = [f'{name}(x)' for name in function_names + ['abs']]
+    formulas += ['log(x, 2)', 'log(x, 10)', 'abs(-x)']
+    for formula in formulas:
+        f = compile_formula(formula)
+        expected = np.array([f(float(x_)) for x_ in x])
+        assert np.abs(f(x) - expected).max() < 1E-14, formula
+
+def test_rejected():
+    bad_formulas = [
+        'x.__class__',                       # attribute access
+        '__import__("os").system("ls")',     # builtins
+        'open("data.txt")',
+        '(lambda: 1)()',                     # lambdas
+        '[x for x in range(3)]',             # comprehensions
+        'sum(x for x in [1, 2])',
+        'log(x, base=2)',                    # keyword arguments
+        'sin(*[x])',
+        'sin(x, x)',                         # would be numpy's out
+        'log(x, 2, 3)',
+        'sin()',
+        'x[0]',
+        '"text"',
+        'y + 1',                             # unknown name
+        'x if x > 0 else 0',
+        'x = 1',
+    ]
+    for formula in bad_formulas:
+        try:
+            compile_formula(formula)
+        except ValueError:
+            pass
+        else:
+            assert False, f'{formula!r} was accepted'
+    for variable in '__builtins__', 'sin', '1x':
+        try:
+            compile_formula('1', variables=(variable,))
+        except ValueError:
+            pass
+        else:
+            assert False, f'variable name {variable!r} was accepted'
+
+test_accepted()
+test_scalar_vector()
+test_rejected()
@@ -0,0 +1,74 @@
+"""
+Offscreen version of animation_v2.py, for making long animations
+without a screen. All frames are computed at once as a 2D array
+(one row per frame), and the frames are drawn with the Agg backend
+using blitting: the axes and labels are drawn once, and for each
+frame only the curve is redrawn on top of a saved background. The
+frames can be split between several worker processes, and the
+PNG files can be encoded to a movie with ffmpeg.
+"""
+import shutil
+import subprocess
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+def f(x, m, s):
+    return (1.0/(np.sqrt(2*np.pi)*s))*np.exp(-0.5*((x-m)/s)**2)
+
+def render_frames(x, Y, first, axis, filename='tmp_%04d.png'):
+    """
+    Save the curves (x, Y[i]) as PNG files, numbered from first.
+    axis is [xmin, xmax, ymin, ymax], the same for all frames.
+    """
+    fig = plt.figure()
+    plt.axis(axis)
+    plt.xlabel('x')
+    plt.ylabel('f')
+    line, = plt.plot(x, Y[0], animated=True)  # not part of the background
+    fig.canvas.draw()
+    background = fig.canvas.copy_from_bbox(fig.bbox)
+    for i, y in enumerate(Y):
+        fig.canvas.restore_region(background)
+        line.set_ydata(y)
+        fig.draw_artist(line)
+        image = np.asarray(fig.canvas.buffer_rgba())
+        plt.imsave(filename % (first + i), image)
+    plt.close(fig)
+    return len(Y)
+
+def render(x, Y, axis, filename='tmp_%04d.png', workers=1):
+    """Render all frames, split into one block of frames per worker."""
+    if workers == 1:
+        return render_frames(x, Y, 0, axis, filename)
+    blocks = np.array_split(np.arange(len(Y)), workers)
+    with ProcessPoolExecutor(workers) as executor:
+        jobs = [executor.submit(render_frames, x, Y[b], b[0], axis, filename)
+                for b in blocks if len(b) > 0]
+        return sum(job.result() for job in jobs)
+
+def encode(filename='tmp_%04d.png', movie='movie.mp4', fps=20):
+    """Make a movie of the PNG files with ffmpeg, if it is installed."""
+    if shutil.which('ffmpeg') is None:
+        print('ffmpeg not found, the frames are kept as PNG files')
+        return False
+    subprocess.run(['ffmpeg', '-y', '-loglevel', 'error', '-framerate',
+                    str(fps), '-i', filename, '-pix_fmt', 'yuv420p', movie],
+                   check=True)
+    return True
+
+
+if __name__ == '__main__':
+    m = 0;  s_start = 2;  s_stop = 0.2
+    s_values = np.linspace(s_start, s_stop, 30)
+    x = np.linspace(m -3*s_start, m + 3*s_start, 1000)
+
+    # all frames at once: row i is f(x, m, s_values[i])
+    Y = f(x[np.newaxis, :], m, s_values[:, np.newaxis])
+    max_f = f(m, m, s_stop)
+
+    n = render(x, Y, [x[0], x[-1], -0.1, max_f], workers=4)
+    print(f'{n} frames rendered')
+    encode()
@@ -0,0 +1,139 @@
+"""
+Compact table of the cities in cities.txt, as an alternative to
+the dict of dicts in read_cities_join.py. Each property is stored
+as one NumPy array (a column), and a dict maps the city names to
+row numbers. Geographic queries use a grid index: the cities are
+sorted by the lat/long grid cell they belong to, so a query only
+has to look at the cities in the cells near the query point.
+"""
+from math import radians, degrees, cos
+import numpy as np
+
+R_earth = 6371.0    # km
+
+def distance(lat1, long1, lat2, long2):
+    """Great circle distance in km (haversine formula), for arrays."""
+    lat1, long1, lat2, long2 = map(np.radians, (lat1, long1, lat2, long2))
+    a = np.sin((lat2 - lat1)/2)**2 + \
+        np.cos(lat1)*np.cos(lat2)*np.sin((long2 - long1)/2)**2
+    return 2*R_earth*np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+class CityTable:
+    def __init__(self, names, lat, long, pop, cell_size=1.0):
+        self.names = np.array(names)
+        self.lat = np.asarray(lat, dtype=float)
+        self.long = np.asarray(long, dtype=float)
+        self.pop = np.asarray(pop, dtype=np.int64)
+        self.index = {name: i for i, name in enumerate(names)}
+        # population index, for range queries with searchsorted
+        self.pop_order = np.argsort(self.pop, kind='stable')
+        self.pop_sorted = self.pop[self.pop_order]
+        self.build_grid(cell_size)
+
+    @classmethod
+    def from_file(cls, filename, cell_size=1.0):
+        """Read a file on the same format as cities.txt."""
+        names, lat, long, pop = [], [], [], []
+        with open(filename) as infile:
+            for line in infile:
+                words = line.split()
+                names.append(', '.join(words[:2]))
+                lat.append(float(words[2]))
+                long.append(float(words[3]))
+                pop.append(int(words[4]))
+        return cls(names, lat, long, pop, cell_size)
+
+    def build_grid(self, cell_size):
+        self.cell_size = cell_size
+        self.n_lat = int(np.ceil(180/cell_size))
+        self.n_long = int(np.ceil(360/cell_size))
+        cells = self.cell(self.lat, self.long)
+        # rows sorted by cell; the rows in cell c are
+        # grid_rows[grid_start[c]:grid_start[c+1]]
+        self.grid_rows = np.argsort(cells, kind='stable')
+        self.grid_start = np.searchsorted(cells[self.grid_rows],
+                                          np.arange(self.n_lat*self.n_long + 1))
+
+    def cell(self, lat, long):
+        i = np.clip(((lat + 90)//self.cell_size).astype(int), 0, self.n_lat - 1)
+        j = ((long + 180)//self.cell_size).astype(int) % self.n_long
+        return i*self.n_long + j
+
+    def candidates(self, lat, long, r):
+        """Rows of all cities in the grid cells within r km of (lat, long)."""
+        dlat = degrees(r/R_earth)
+        lat_min, lat_max = max(lat - dlat, -90), min(lat + dlat, 90)
+        i = np.arange(int((lat_min + 90)//self.cell_size),
+                      min(int((lat_max + 90)//self.cell_size), self.n_lat - 1) + 1)
+        max_abs_lat = max(abs(lat_min), abs(lat_max))
+        if max_abs_lat >= 89.9 or dlat/cos(radians(max_abs_lat)) >= 180:
+            j = np.arange(self.n_long)    # close to a pole: all longitudes
+        else:
+            dlong = dlat/cos(radians(max_abs_lat))
+            j = np.arange(int((long - dlong + 180)//self.cell_size),
+                          int((long + dlong + 180)//self.cell_size) + 1)
+            j = np.unique(j % self.n_long)
+        cells = (i[:, np.newaxis]*self.n_long + j[np.newaxis, :]).ravel()
+        start, stop = self.grid_start[cells], self.grid_start[cells + 1]
+        nonempty = stop > start
+        if not nonempty.any():
+            return np.zeros(0, dtype=int)
+        return np.concatenate([self.grid_rows[a:b] for a, b in
+                               zip(start[nonempty], stop[nonempty])])
+
+    def within(self, lat, long, r, min_pop=0, max_pop=None):
+        """
+        Return the rows of the cities within r km of (lat, long), and
+        their distances, sorted by distance. Only cities with
+        min_pop <= population <= max_pop are included.
+        """
+        rows = self.candidates(lat, long, r)
+        d = distance(lat, long, self.lat[rows], self.long[rows])
+        ok = (d <= r) & (self.pop[rows] >= min_pop)
+        if max_pop is not None:
+            ok &= self.pop[rows] <= max_pop
+        rows, d = rows[ok], d[ok]
+        order = np.argsort(d, kind='stable')
+        return rows[order], d[order]
+
+    def nearest(self, lat, long, k=1, min_pop=0, max_pop=None):
+        """
+        Return the rows of the k cities closest to (lat, long), and
+        their distances. The search radius is doubled until at least
+        k cities are found; all cities within the radius are found,
+        so the k closest of these are the k closest overall.
+        """
+        r = self.cell_size*111.0    # about one cell
+        while True:
+            rows, d = self.within(lat, long, r, min_pop, max_pop)
+            if len(rows) >= k or r > np.pi*R_earth:
+                return rows[:k], d[:k]
+            r *= 2
+
+    def population_range(self, min_pop, max_pop):
+        """Rows of the cities with min_pop <= population <= max_pop."""
+        start = np.searchsorted(self.pop_sorted, min_pop, side='left')
+        stop = np.searchsorted(self.pop_sorted, max_pop, side='right')
+        return self.pop_order[start:stop]
+
+    def __getitem__(self, name):
+        # same data as in the dict of dicts in read_cities_join.py
+        i = self.index[name]
+        return {'lat': float(self.lat[i]), 'long': float(self.long[i]),
+                'pop': int(self.pop[i])}
+
+    def __len__(self):
+        return len(self.names)
+
+
+if __name__ == '__main__':
+    cities = CityTable.from_file('cities.txt')
+    print(cities['Oslo, Norway'])
+
+    rows, d = cities.nearest(60.39, 5.32, k=2)   # Bergen
+    for name, d_ in zip(cities.names[rows], d):
+        print(f'{name}: {d_:.0f} km')
+
+    rows, d = cities.within(59.9, 10.75, 500, min_pop=100000)
+    print(cities.names[rows])
+    print(cities.names[cities.population_range(50000, 1000000)])
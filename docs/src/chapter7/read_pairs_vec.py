@@ -0,0 +1,67 @@
+"""
+Fast reading of files with pairs of numbers on the form (x,y), like
+pairs.txt. Instead of splitting and stripping every pair in Python,
+as in read_pairs.py, a whole buffer of bytes is converted at once:
+the characters '(', ',' and ')' are replaced by blanks, and the
+remaining numbers are converted to a float64 array of shape (N, 2).
+Large files are processed in chunks, from a file object or from a
+memory-mapped file.
+"""
+import mmap
+import numpy as np
+
+separators = bytes.maketrans(b'(),', b'   ')
+
+def parse_pairs(buffer):
+    """Return the pairs (x,y) in the bytes buffer as an (N, 2) array."""
+    n_pairs = buffer.count(b'(')
+    numbers = np.array(buffer.translate(separators).split(), dtype=float)
+    if len(numbers) != 2*n_pairs or buffer.count(b')') != n_pairs:
+        raise ValueError('data are not pairs on the form (x,y)')
+    return numbers.reshape(n_pairs, 2)
+
+def iter_pairs(infile, chunk_size=2**24):
+    """
+    Read pairs from a file object opened in binary mode, and yield
+    one (N, 2) array for each chunk of about chunk_size bytes.
+    """
+    rest = b''
+    while True:
+        data = infile.read(chunk_size)
+        if not data:
+            break
+        data = rest + data
+        end = data.rfind(b')') + 1   # the last complete pair
+        rest = data[end:]
+        yield parse_pairs(data[:end])
+    if rest.strip():
+        raise ValueError('incomplete pair at the end of the file')
+
+def read_pairs(filename, chunk_size=2**24):
+    """
+    Return all pairs in a file as an (N, 2) array. The file is
+    memory-mapped and parsed in chunks of about chunk_size bytes,
+    so only one chunk of text is in memory at a time.
+    """
+    chunks = []
+    with open(filename, 'rb') as infile:
+        if len(infile.read(1)) == 0:
+            return np.zeros((0, 2))   # mmap cannot map an empty file
+        with mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = 0
+            while start < len(data):
+                end = data.rfind(b')', start, start + chunk_size) + 1
+                if end == 0:           # no complete pair in the chunk
+                    end = data.find(b')', start) + 1 or len(data)
+                chunks.append(parse_pairs(data[start:end]))
+                start = end
+    return np.concatenate(chunks)
+
+
+if __name__ == '__main__':
+    pairs = read_pairs('pairs.txt')
+    print(pairs)
+
+    with open('pairs.txt', 'rb') as infile:
+        for chunk in iter_pairs(infile, chunk_size=20):
+            print(chunk.tolist())
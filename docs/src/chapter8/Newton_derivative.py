@@ -1,4 +1,5 @@
 from derivative import Derivative
+from memoize import Memoize
 
 def Newton2(f, dfdx, x0, max_it=20, tol= 1e-6):
     f0 = f(x0)
@@ -13,16 +14,19 @@ def Newton2(f, dfdx, x0, max_it=20, tol= 1e-6):
     return x0, converged, iter
 
 
-def f(x):
-    return 100000*(x - 0.9)**2 * (x - 1.1)**3
+if __name__ == '__main__':
+    def f(x):
+        return 100000*(x - 0.9)**2 * (x - 1.1)**3
 
-dfdx = Derivative(f)
-xstart = 1.01
-result = Newton2(f, dfdx, xstart)
-sol, converged, its = result
+    f = Memoize(f)       # f(x0) is then reused by Derivative
+    dfdx = Derivative(f)
+    xstart = 1.01
+    result = Newton2(f, dfdx, xstart)
+    sol, converged, its = result
 
-if converged:
-    print(f'The method converged in {its} iterations')
-    print(f'Solution x0={sol}, f(x0) = {f(sol)}')
-else:
-    print('The method did not converge')
+    if converged:
+        print(f'The method converged in {its} iterations')
+        print(f'Solution x0={sol}, f(x0) = {f(sol)}')
+        print(f'f was evaluated {f.misses} times, {f.hits} values were reused')
+    else:
+        print('The method did not converge')
@@ -20,11 +20,12 @@ class BankAccountP:
         s = f'{first} {last}, {number}, balance: {bal}'
         print(s)
 
-a1 = BankAccountP('John', 'Olsson', '19371554951', 20000)
-a2 = BankAccountP('Liz', 'Olsson',  '19371564761', 20000)
-a1.deposit(1000)
-a1.withdraw(4000)
-a2.withdraw(10500)
-a1.withdraw(3500)
-print("a1's balance:", a1.get_balance())
-a1.print_info()
+if __name__ == '__main__':
+    a1 = BankAccountP('John', 'Olsson', '19371554951', 20000)
+    a2 = BankAccountP('Liz', 'Olsson',  '19371564761', 20000)
+    a1.deposit(1000)
+    a1.withdraw(4000)
+    a2.withdraw(10500)
+    a1.withdraw(3500)
+    print("a1's balance:", a1.get_balance())
+    a1.print_info()
@@ -0,0 +1,135 @@
+"""
+Storage of many bank accounts in columns (NumPy arrays) instead of
+one BankAccountP object per account. Deposits and withdrawals can
+be applied in batches, as arrays of account numbers and amounts,
+and AccountView gives access to a single account through the same
+methods as class BankAccountP.
+"""
+import numpy as np
+
+class AccountStore:
+    def __init__(self, capacity=1024):
+        self.n = 0        # number of accounts
+        self._first_name = np.zeros(capacity, dtype='U1')
+        self._last_name = np.zeros(capacity, dtype='U1')
+        self._number = np.zeros(capacity, dtype='U1')
+        self._balance = np.zeros(capacity, dtype=float)
+        self.index = {}   # account number -> row
+        self._sorted = None   # index for lookup of arrays of numbers
+
+    def store(self, name, values):
+        """Append values to column name, growing capacity and width."""
+        column = getattr(self, name)
+        n = self.n + len(values)
+        dtype = np.result_type(column.dtype, values.dtype)
+        if n > len(column) or dtype != column.dtype:
+            new = np.zeros(max(n, 2*len(column)), dtype=dtype)
+            new[:self.n] = column[:self.n]
+            column = new
+            setattr(self, name, column)
+        column[self.n:n] = values
+
+    def add(self, first_names, last_names, numbers, balances):
+        """
+        Open one account, or many accounts given as arrays. Single
+        names or balances are used for all the accounts.
+        """
+        numbers = np.atleast_1d(np.asarray(numbers, dtype=str))
+        n = len(numbers)
+        try:
+            first_names, last_names, balances = [
+                np.broadcast_to(np.asarray(values, dtype=dtype), (n,))
+                for values, dtype in [(first_names, str), (last_names, str),
+                                      (balances, float)]]
+        except ValueError:
+            raise ValueError('names and balances must be single values '
+                             f'or have the same length as numbers ({n})')
+        if len(set(numbers)) < n or \
+           any(number in self.index for number in numbers):
+            raise ValueError('account numbers must be unique')
+        self.store('_first_name', first_names)
+        self.store('_last_name', last_names)
+        self.store('_number', numbers)
+        self.store('_balance', balances)
+        self.index.update(zip(numbers.tolist(), range(self.n, self.n + n)))
+        self.n += n
+        self._sorted = None
+
+    def rows(self, numbers):
+        """Return the rows of an array of account numbers."""
+        if self._sorted is None:
+            order = np.argsort(self._number[:self.n])
+            self._sorted = order, self._number[order]
+        order, sorted_numbers = self._sorted
+        numbers = np.asarray(numbers, dtype=str)
+        if self.n == 0:
+            if numbers.size == 0:
+                return np.zeros(numbers.shape, dtype=int)
+            raise KeyError(f'unknown accounts: {numbers}')
+        pos = np.searchsorted(sorted_numbers, numbers)
+        pos = np.minimum(pos, self.n - 1)
+        found = sorted_numbers[pos] == numbers
+        if not found.all():
+            raise KeyError(f'unknown accounts: {numbers[~found]}')
+        return order[pos]
+
+    def deposit(self, numbers, amounts):
+        """Deposit amounts[i] to account numbers[i], for all i."""
+        np.add.at(self._balance, self.rows(numbers), amounts)
+
+    def withdraw(self, numbers, amounts):
+        np.subtract.at(self._balance, self.rows(numbers), amounts)
+
+    def get_balance(self, numbers):
+        return self._balance[self.rows(numbers)]
+
+    def __getitem__(self, number):
+        return AccountView(self, self.index[number])
+
+    def __len__(self):
+        return self.n
+
+
+class AccountView:
+    """One account in an AccountStore, used like a BankAccountP."""
+    __slots__ = ('store', 'row')
+
+    def __init__(self, store, row):
+        self.store, self.row = store, row
+
+    def deposit(self, amount):
+        self.store._balance[self.row] += amount
+
+    def withdraw(self, amount):
+        self.store._balance[self.row] -= amount
+
+    def get_balance(self):
+        return self.store._balance[self.row].item()
+
+    def print_info(self):
+        s, i = self.store, self.row
+        first = s._first_name[i]; last = s._last_name[i]
+        number = s._number[i]; bal = s._balance[i].item()
+        s = f'{first} {last}, {number}, balance: {bal}'
+        print(s)
+
+
+if __name__ == '__main__':
+    accounts = AccountStore()
+    accounts.add('John', 'Olsson', '19371554951', 20000)
+    accounts.add('Liz', 'Olsson', '19371564761', 20000)
+    a1 = accounts['19371554951']
+    a1.deposit(1000)
+    a1.withdraw(4000)
+    accounts['19371564761'].withdraw(10500)
+    a1.withdraw(3500)
+    print("a1's balance:", a1.get_balance())
+    a1.print_info()
+
+    # many accounts and a batch of transactions
+    n = 100000
+    numbers = np.arange(n).astype(str)
+    accounts.add(['Ola']*n, ['Nordmann']*n, numbers, np.zeros(n))
+    rng = np.random.default_rng(1)
+    accounts.deposit(rng.choice(numbers, 10**6), np.ones(10**6))
+    print(len(accounts), accounts.get_balance(numbers).sum())
@@ -0,0 +1,163 @@
+"""
+Thread-safe transactions between BankAccountP objects. The methods
+deposit and withdraw in BankAccountP are not safe when several
+threads change the same balance, since 'self._balance += amount'
+reads and writes the balance in separate steps. The engine protects
+the accounts with a fixed set of locks (lock striping: account
+number i uses lock hash(i) % n_locks), and writes every transaction
+to an append-only binary ledger, from which the balances can be
+recomputed on startup.
+"""
+import os
+import struct
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from account_protected import BankAccountP
+
+# one ledger record: from account, to account, amount
+# (account 0 is outside the bank, used for deposits and withdrawals)
+record = struct.Struct('<qqd')
+record_dtype = np.dtype([('src', '<i8'), ('dst', '<i8'), ('amount', '<f8')])
+
+def ledger_ids(accounts):
+    """
+    Return a dict mapping the account numbers to the integers stored
+    in the ledger. The numbers must be strings of digits without
+    leading zeros (so '01' and '1' cannot both exist), not '0', and
+    fit in 64 bits.
+    """
+    ids = {}
+    for number in accounts:
+        if not (isinstance(number, str) and number.isdigit()
+                and str(int(number)) == number and 0 < int(number) < 2**63):
+            raise ValueError(f'invalid account number {number!r}')
+        ids[number] = int(number)
+    return ids
+
+class TransactionEngine:
+    def __init__(self, accounts, ledger_file, n_locks=64, sync_every=1000):
+        """
+        accounts is a dict mapping account numbers to BankAccountP
+        objects. The ledger is flushed to disk with os.fsync after
+        every sync_every transactions, and by sync() and close().
+        """
+        self.accounts = accounts
+        self.ids = ledger_ids(accounts)
+        self.locks = [threading.Lock() for i in range(n_locks)]
+        self.ledger = open(ledger_file, 'ab')
+        self.ledger_lock = threading.Lock()
+        self.sync_every = sync_every
+        self.unsynced = 0
+        self.transactions = 0
+        self.start_time = time.perf_counter()
+
+    def transfer(self, src, dst, amount):
+        """
+        Move amount from account src to account dst. src or dst
+        may be None for deposits and withdrawals. Unknown accounts
+        raise KeyError before anything is changed.
+        """
+        numbers = [n for n in (src, dst) if n is not None]
+        accounts = [self.accounts[n] for n in numbers]  # check both first
+        data = record.pack(self.ids[src] if src is not None else 0,
+                           self.ids[dst] if dst is not None else 0, amount)
+        # acquire the locks in a fixed order to avoid deadlocks
+        locks = sorted({hash(n) % len(self.locks) for n in numbers})
+        for i in locks:
+            self.locks[i].acquire()
+        try:
+            # the record is written first: if this fails, no balance
+            # is changed, so the ledger always matches the balances
+            self.log(data)
+            if src is not None:
+                accounts[0].withdraw(amount)
+            if dst is not None:
+                accounts[-1].deposit(amount)
+        finally:
+            for i in reversed(locks):
+                self.locks[i].release()
+
+    def deposit(self, number, amount):
+        self.transfer(None, number, amount)
+
+    def withdraw(self, number, amount):
+        self.transfer(number, None, amount)
+
+    def log(self, data):
+        with self.ledger_lock:
+            self.ledger.write(data)
+            self.transactions += 1
+            self.unsynced += 1
+            if self.unsynced >= self.sync_every:
+                self._sync()
+
+    def _sync(self):
+        self.ledger.flush()
+        os.fsync(self.ledger.fileno())
+        self.unsynced = 0
+
+    def sync(self):
+        with self.ledger_lock:
+            self._sync()
+
+    def apply_batch(self, transfers, max_workers=8):
+        """Apply a list of (src, dst, amount) transfers concurrently."""
+        with ThreadPoolExecutor(max_workers) as executor:
+            list(executor.map(lambda t: self.transfer(*t), transfers))
+
+    def throughput(self):
+        """Return the number of transactions and transactions per second."""
+        elapsed = time.perf_counter() - self.start_time
+        return self.transactions, self.transactions/elapsed
+
+    def close(self):
+        self.sync()
+        self.ledger.close()
+
+def read_ledger(ledger_file):
+    """Return all records in a ledger as a structured array."""
+    return np.fromfile(ledger_file, dtype=record_dtype)
+
+def replay(ledger_file, accounts):
+    """
+    Apply all transactions in a ledger to accounts (a dict of
+    BankAccountP objects with their initial balances).
+    """
+    numbers = {id: number for number, id in ledger_ids(accounts).items()}
+    for src, dst, amount in read_ledger(ledger_file).tolist():
+        if src != 0:
+            accounts[numbers[src]].withdraw(amount)
+        if dst != 0:
+            accounts[numbers[dst]].deposit(amount)
+
+
+if __name__ == '__main__':
+    import random
+
+    def make_accounts():
+        return {str(1000 + i): BankAccountP('Ola', 'Nordmann', str(1000 + i), 1000)
+                for i in range(100)}
+
+    if os.path.exists('ledger.bin'):
+        os.remove('ledger.bin')
+    accounts = make_accounts()
+    engine = TransactionEngine(accounts, 'ledger.bin')
+    numbers = list(accounts)
+    transfers = [(random.choice(numbers), random.choice(numbers),
+                  random.randint(1, 100)) for i in range(20000)]
+    engine.apply_batch(transfers)
+    engine.deposit('1000', 500)
+    engine.close()
+    transactions, rate = engine.throughput()
+    print(f'{transactions} transactions, {rate:.0f} per second')
+    total = sum(a.get_balance() for a in accounts.values())
+    print(f'Total balance: {total}')   # 100*1000 + 500
+
+    # recompute the balances from the ledger, as on startup
+    restored = make_accounts()
+    replay('ledger.bin', restored)
+    print(all(restored[n].get_balance() == accounts[n].get_balance()
+              for n in accounts))
+    os.remove('ledger.bin')
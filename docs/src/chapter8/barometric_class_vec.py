@@ -0,0 +1,87 @@
+"""
+Vectorized version of class Barometric. The constant M*g/R is
+computed once in the constructor, and h and T can be NumPy arrays
+of any (broadcastable) shape, for instance pressure on a 3D grid.
+Class LayeredBarometric models an atmosphere of layers, where the
+temperature changes linearly with the height in each layer.
+"""
+import numpy as np
+
+g = 9.81         #m/(s*s)
+R = 8.314        #J/(K*mol)
+M = 0.02896      #kg/mol
+
+class Barometric:
+    def __init__(self, T, p0=100.0):
+        self.T = T            #K
+        self.p0 = p0          #kPa
+        self.C = M*g/R        #K/m
+        self.h0 = self.T/self.C    # scale height (m), as in Barometric2
+
+    def __call__(self, h, T=None):
+        # T=None means the temperature given to the constructor
+        if T is None:
+            return self.p0*np.exp(-np.asarray(h)/self.h0)
+        return self.p0*np.exp(-self.C*np.asarray(h)/T)
+
+    def __str__(self):
+        return f'p0 * exp(-M*g*h/(R*T)); T = {self.T}'
+
+    def __repr__(self):
+        return f'Barometric({self.T})'
+
+class LayeredBarometric:
+    """
+    Pressure in an atmosphere of layers starting at the heights in
+    base (m), with the temperature changing by lapse[i] K per meter
+    in layer i. The default layers are those of the International
+    Standard Atmosphere, up to 86 km.
+    """
+    def __init__(self, base=(0, 11000, 20000, 32000, 47000, 51000, 71000),
+                 lapse=(-0.0065, 0, 0.001, 0.0028, 0, -0.0028, -0.002),
+                 T0=288.15, p0=100.0):
+        self.base = np.array(base, dtype=float)
+        self.lapse = np.array(lapse, dtype=float)
+        self.C = M*g/R
+        # temperature and pressure at the base of each layer
+        self.T_base = np.zeros(len(base))
+        self.p_base = np.zeros(len(base))
+        self.T_base[0], self.p_base[0] = T0, p0
+        for i in range(1, len(base)):
+            dh = self.base[i] - self.base[i-1]
+            self.T_base[i], self.p_base[i] = self.layer(i-1, dh)
+
+    def layer(self, i, dh):
+        """Temperature and pressure dh meters above the base of layer i."""
+        T_b, p_b, L = self.T_base[i], self.p_base[i], self.lapse[i]
+        T = T_b + L*dh
+        isothermal = L == 0
+        L = np.where(isothermal, 1.0, L)    # avoid division by zero
+        p = np.where(isothermal, p_b*np.exp(-self.C*dh/T_b),
+                     p_b*(T_b/T)**(self.C/L))
+        return T, p
+
+    def __call__(self, h):
+        h = np.asarray(h, dtype=float)
+        i = np.searchsorted(self.base, h, side='right') - 1
+        i = np.maximum(i, 0)   # heights below the lowest base
+        return self.layer(i, h - self.base[i])[1]
+
+    def temperature(self, h):
+        h = np.asarray(h, dtype=float)
+        i = np.maximum(np.searchsorted(self.base, h, side='right') - 1, 0)
+        return self.layer(i, h - self.base[i])[0]
+
+
+if __name__ == '__main__':
+    baro = Barometric(245)
+    print(baro(2346))
+    h = np.linspace(0, 10000, 5)
+    print(baro(h))
+    # heights along one axis, temperatures along the other:
+    print(baro(h, np.array([[245.0], [273.0]])))
+
+    atmosphere = LayeredBarometric()
+    h = np.array([0, 5000, 11000, 20000, 50000, 80000])
+    print(atmosphere(h))
+    print(atmosphere.temperature(h))
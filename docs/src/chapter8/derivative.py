@@ -1,3 +1,6 @@
+import numpy as np
+from vectorized import is_vectorized
+
 class Derivative:
     def __init__(self, f, h=1E-5):
         self.f = f
@@ -5,7 +8,14 @@ class Derivative:
 
     def __call__(self, x):
         f, h = self.f, self.h      # make short forms
-        return (f(x+h) - f(x))/h
+        # one call to f with both points stacked, if f is vectorized:
+        points = np.array([x, np.add(x, h)])
+        values = is_vectorized(f, points)
+        if values is None:
+            if np.ndim(x) > 0:
+                f = np.vectorize(f, otypes=[float])
+            return (f(x+h) - f(x))/h
+        return ((values[1] - values[0])/h)[()]
 
 from math import *
 df = Derivative(sin)
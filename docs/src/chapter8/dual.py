@@ -0,0 +1,201 @@
+"""
+Forward mode automatic differentiation with dual numbers. A dual
+number a + b*eps, with eps**2 = 0, carries a value a and a
+derivative b through every arithmetic operation, so f(Dual(x, 1))
+gives both f(x) and the exact derivative f'(x) in one pass through
+f. The value and derivative can be arrays, which gives the
+derivative on a whole grid in one call.
+
+f must be written with arithmetic operators and NumPy functions
+(np.sin, np.exp, ...), or the functions sin, cos, ... defined at
+the end of this module. The functions in the math module only
+accept numbers, and cannot be used.
+"""
+import numpy as np
+
+class Dual:
+    def __init__(self, value, deriv=0.0):
+        self.value, self.deriv = value, deriv
+
+    def __add__(self, other):
+        other = dual(other)
+        return Dual(self.value + other.value, self.deriv + other.deriv)
+
+    def __sub__(self, other):
+        other = dual(other)
+        return Dual(self.value - other.value, self.deriv - other.deriv)
+
+    def __mul__(self, other):
+        other = dual(other)
+        return Dual(self.value*other.value,
+                    self.deriv*other.value + self.value*other.deriv)
+
+    def __truediv__(self, other):
+        other = dual(other)
+        return Dual(self.value/other.value,
+                    (self.deriv*other.value - self.value*other.deriv)/
+                    other.value**2)
+
+    def __pow__(self, other):
+        if isinstance(other, Dual):
+            if np.any(other.deriv != 0):
+                # a**b = exp(b*ln(a))
+                return exp(other*log(self))
+            other = other.value
+        # constant exponent, also valid for negative values; a float
+        # base, since numpy does not allow int**(negative int)
+        base = np.asarray(self.value, dtype=float)
+        if np.all(other == 0):
+            return Dual(np.power(base, other), 0*self.deriv)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # e.g. x**0.5 at x=0 gives an infinite derivative
+            deriv = other*np.power(base, other - 1)*self.deriv
+        return Dual(np.power(base, other), deriv)
+
+    def __radd__(self, other):
+        return dual(other) + self
+
+    def __rsub__(self, other):
+        return dual(other) - self
+
+    def __rmul__(self, other):
+        return dual(other)*self
+
+    def __rtruediv__(self, other):
+        return dual(other)/self
+
+    def __rpow__(self, other):
+        return dual(other)**self
+
+    def __neg__(self):
+        return Dual(-self.value, -self.deriv)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return Dual(np.abs(self.value), np.sign(self.value)*self.deriv)
+
+    # comparisons use the value, so that f can contain tests like 'if x > 0'
+    def __lt__(self, other):
+        return self.value < dual(other).value
+
+    def __le__(self, other):
+        return self.value <= dual(other).value
+
+    def __gt__(self, other):
+        return self.value > dual(other).value
+
+    def __ge__(self, other):
+        return self.value >= dual(other).value
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        # called by NumPy for np.sin(x), array + x, etc.
+        if method != '__call__' or kwargs:
+            return NotImplemented
+        if ufunc in binary_ufuncs:
+            a, b = inputs
+            return binary_ufuncs[ufunc](dual(a), dual(b))
+        if ufunc in unary_ufuncs:
+            x, = inputs
+            dfdx = unary_ufuncs[ufunc]
+            return Dual(ufunc(x.value), dfdx(x.value)*x.deriv)
+        return NotImplemented
+
+    def __str__(self):
+        return f'{self.value} + {self.deriv}*eps'
+
+    def __repr__(self):
+        return f'Dual({self.value!r}, {self.deriv!r})'
+
+def dual(x):
+    """Return x as a Dual, constants have zero derivative."""
+    return x if isinstance(x, Dual) else Dual(x, 0.0)
+
+# derivatives of the NumPy functions
+unary_ufuncs = {
+    np.sin: np.cos,
+    np.cos: lambda x: -np.sin(x),
+    np.tan: lambda x: 1/np.cos(x)**2,
+    np.arcsin: lambda x: 1/np.sqrt(1 - x**2),
+    np.arccos: lambda x: -1/np.sqrt(1 - x**2),
+    np.arctan: lambda x: 1/(1 + x**2),
+    np.sinh: np.cosh,
+    np.cosh: np.sinh,
+    np.tanh: lambda x: 1/np.cosh(x)**2,
+    np.exp: np.exp,
+    np.log: lambda x: 1/x,
+    np.log10: lambda x: 1/(x*np.log(10)),
+    np.sqrt: lambda x: 0.5/np.sqrt(x),
+    np.negative: lambda x: -np.ones_like(x),
+    np.absolute: np.sign,
+}
+
+binary_ufuncs = {
+    np.add: lambda a, b: a + b,
+    np.subtract: lambda a, b: a - b,
+    np.multiply: lambda a, b: a*b,
+    np.true_divide: lambda a, b: a/b,
+    np.power: lambda a, b: a**b,
+}
+
+# functions that can replace the ones from math in f
+sin, cos, tan, exp, log, sqrt = np.sin, np.cos, np.tan, np.exp, np.log, np.sqrt
+
+class AutoDerivative:
+    """
+    Exact derivative of f by automatic differentiation, with the
+    same interface as class Derivative. x can be a number or an array.
+    """
+    def __init__(self, f):
+        self.f = f
+
+    def __call__(self, x):
+        y = self.f(Dual(x, np.ones_like(x, dtype=float)))
+        return dual(y).deriv
+
+    def value_and_derivative(self, x):
+        y = dual(self.f(Dual(x, np.ones_like(x, dtype=float))))
+        return y.value, y.deriv
+
+def Newton_dual(f, x0, max_it=20, tol=1e-6):
+    """
+    Newton's method as Newton2 in Newton_derivative.py, but f(x)
+    and f'(x) are both computed in one pass through f.
+    """
+    df = AutoDerivative(f)
+    f0, dfdx0 = df.value_and_derivative(x0)
+    iter = 0
+    while abs(f0) > tol and iter < max_it:
+        x0 = x0 - f0/dfdx0
+        f0, dfdx0 = df.value_and_derivative(x0)
+        iter += 1
+
+    converged = iter < max_it
+    return x0, converged, iter
+
+
+if __name__ == '__main__':
+    from derivative import Derivative
+    from Newton_derivative import Newton2
+
+    df = AutoDerivative(np.sin)
+    x = np.pi/4
+    print(f'Automatic: {df(x)}')
+    print(f'Exact: {np.cos(x)}')
+    x = np.linspace(0, np.pi, 5)
+    print(f'On a grid: {df(x)}')
+
+    calls = 0
+    def f(x):
+        global calls
+        calls += 1
+        return 100000*(x - 0.9)**2 * (x - 1.1)**3
+
+    sol, converged, its = Newton2(f, Derivative(f), 1.01)
+    print(f'Derivative: x0={sol}, converged={converged}, '
+          f'{its} iterations, {calls} calls to f')
+    calls = 0
+    sol, converged, its = Newton_dual(f, 1.01)
+    print(f'Newton_dual: x0={sol}, converged={converged}, '
+          f'{its} iterations, {calls} calls to f')
@@ -0,0 +1,121 @@
+"""
+Generic version of make_table from barometric_class_table.py. The
+function f (an ordinary function or a method like Barometric.value)
+is evaluated in chunks of t values: with one call per chunk if f is
+vectorized, otherwise one call per t value, optionally spread over
+the workers of a thread or process pool. The table is sent to a
+sink, which writes it to stdout, a text file, a .npy file or a raw
+memory-mapped binary file.
+"""
+import sys
+import numpy as np
+from vectorized import is_vectorized
+
+class TextSink:
+    """Write the rows 't f(t)' as text to an open file (default stdout)."""
+    def __init__(self, outfile=None, fmt='%g %g\n'):
+        self.outfile = sys.stdout if outfile is None else outfile
+        self.fmt = fmt
+
+    def open(self, n):
+        pass
+
+    def write(self, t, y):
+        self.outfile.write((self.fmt*len(t)) % tuple(np.column_stack((t, y)).ravel()))
+
+    def close(self):
+        self.outfile.flush()
+
+class FileSink(TextSink):
+    """Write the table as text to a file, with a large write buffer."""
+    def __init__(self, filename, fmt='%g %g\n', buffering=2**20):
+        super().__init__(open(filename, 'w', buffering=buffering), fmt)
+
+    def close(self):
+        self.outfile.close()
+
+class NpySink:
+    """Store the table as an (n, 2) array in a .npy file."""
+    def __init__(self, filename):
+        self.filename = filename
+
+    def open(self, n):
+        self.table = np.lib.format.open_memmap(self.filename, mode='w+',
+                                               dtype=float, shape=(n, 2))
+        self.row = 0
+
+    def write(self, t, y):
+        self.table[self.row:self.row + len(t), 0] = t
+        self.table[self.row:self.row + len(t), 1] = y
+        self.row += len(t)
+
+    def close(self):
+        self.table.flush()
+        del self.table
+
+class MemmapSink(NpySink):
+    """Store the table as raw float64 numbers, to be read with np.memmap."""
+    def open(self, n):
+        self.table = np.memmap(self.filename, mode='w+', dtype=float,
+                               shape=(n, 2))
+        self.row = 0
+
+def linspace_chunks(L, R, n, chunk_size):
+    """
+    Yield np.linspace(L, R, n) in chunks of (at most) chunk_size
+    points, without creating the whole array.
+    """
+    h = (R - L)/(n - 1) if n > 1 else 0
+    for start in range(0, n, chunk_size):
+        x = L + h*np.arange(start, min(start + chunk_size, n))
+        if n > 1 and start + len(x) == n:
+            x[-1] = R     # exact endpoint, as in np.linspace
+        yield x
+
+def make_table(f, tstop, n, sink=None, tstart=0, chunk_size=100000,
+               executor=None):
+    """
+    Tabulate f(t) for n values of t in [tstart, tstop] into sink
+    (default: print to stdout). executor, e.g. a ThreadPoolExecutor
+    or a ProcessPoolExecutor, is used to evaluate an f that is not
+    vectorized.
+    """
+    if sink is None:
+        sink = TextSink()
+    vectorized = None     # not known before the first chunk
+    sink.open(n)
+    try:
+        for t in linspace_chunks(tstart, tstop, n, chunk_size):
+            y = None
+            if vectorized is None or vectorized:
+                y = is_vectorized(f, t)
+                vectorized = y is not None
+            if y is None:
+                if executor is None:
+                    y = np.array([f(t_) for t_ in t])
+                else:
+                    y = np.array(list(executor.map(f, t, chunksize=1000)))
+            sink.write(t, y)
+    finally:
+        sink.close()
+    return sink
+
+
+if __name__ == '__main__':
+    import os
+    from math import sin, exp, pi
+    from concurrent.futures import ThreadPoolExecutor
+    from barometric_class_v1 import Barometric
+
+    def g(t):
+        return sin(t)*exp(-t)
+
+    make_table(g, 2*pi, 11)         # send ordinary function
+    make_table(np.sin, 2*pi, 11)    # vectorized function
+
+    b1 = Barometric(2469)
+    with ThreadPoolExecutor(4) as executor:
+        make_table(b1.value, 2*pi, 10**5, NpySink('table.npy'),
+                   executor=executor)
+    print(np.load('table.npy', mmap_mode='r')[-3:])
+    os.remove('table.npy')
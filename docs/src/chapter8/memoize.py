@@ -0,0 +1,80 @@
+"""
+Function wrapper that remembers computed function values, so
+that an expensive f is only evaluated once for each distinct x.
+Useful with Derivative, the Diff classes in chapter 9 and Newton's
+method, which all evaluate f repeatedly at the same points.
+"""
+from collections import OrderedDict
+import numpy as np
+from vectorized import is_vectorized
+
+class Memoize:
+    """
+    Cache of f values, keyed on the exact float value of x. At most
+    maxsize values are kept; the least recently used value is
+    removed when the cache is full. The attributes hits and misses
+    count how many values were found in the cache and how many
+    required a call to f.
+    """
+    def __init__(self, f, maxsize=1024):
+        self.f, self.maxsize = f, maxsize
+        self.cache = OrderedDict()
+        self.hits = self.misses = 0
+
+    def lookup(self, key):
+        value = self.cache[key]        # raises KeyError if missing
+        self.cache.move_to_end(key)    # most recently used is last
+        self.hits += 1
+        return value
+
+    def store(self, key, value):
+        self.cache[key] = value
+        self.misses += 1
+        if len(self.cache) > self.maxsize:
+            self.cache.popitem(last=False)
+
+    def __call__(self, x):
+        if np.ndim(x) == 0:
+            key = float(x)
+            try:
+                return self.lookup(key)
+            except KeyError:
+                value = self.f(x)
+                self.store(key, value)
+                return value
+
+        # array: evaluate f once for all distinct points not in the cache
+        x = np.asarray(x, dtype=float)
+        keys = x.ravel().tolist()
+        values = [None]*len(keys)
+        missing = {}   # key -> positions in keys
+        for i, key in enumerate(keys):
+            if key in self.cache:
+                values[i] = self.lookup(key)
+            else:
+                missing.setdefault(key, []).append(i)
+        if missing:
+            new_x = np.array(list(missing))
+            new_values = is_vectorized(self.f, new_x)
+            if new_values is None:
+                new_values = [self.f(xi) for xi in new_x]
+            for key, value in zip(missing, new_values):
+                self.store(key, value)
+                for i in missing[key]:
+                    values[i] = value
+        return np.array(values).reshape(x.shape)
+
+    def clear(self):
+        self.cache.clear()
+        self.hits = self.misses = 0
+
+
+if __name__ == '__main__':
+    from math import sin
+    from derivative import Derivative
+
+    f = Memoize(sin)
+    dfdx = Derivative(f)
+    for x in [0.1, 0.2, 0.1]:
+        print(f(x), dfdx(x))
+    print(f'hits={f.hits}, misses={f.misses}')
@@ -1,50 +1,111 @@
+import numpy as np
+
+# polynomials with more coefficients than this are multiplied with FFT
+FFT_THRESHOLD = 64
+
+def convolve(a, b):
+    """
+    Return the coefficients of the product of the polynomials with
+    coefficient arrays a and b. Direct convolution is used for small
+    polynomials and FFT convolution for large ones. Integer
+    coefficients give exact integer results.
+    """
+    n = len(a) + len(b) - 1
+    if len(a) == 0 or len(b) == 0:
+        return np.zeros(0, dtype=np.result_type(a, b))
+    exact = a.dtype.kind in 'iuO' and b.dtype.kind in 'iuO'
+    if exact:
+        # bound on the size of the product coefficients
+        bound = int(np.abs(a).max())*int(np.abs(b).max())*min(len(a), len(b))
+        if bound >= 2**63:
+            # would overflow int64, use Python integers
+            return np.convolve(a.astype(object), b.astype(object))
+        if min(len(a), len(b)) <= FFT_THRESHOLD or bound >= 2**40:
+            # FFT round-off errors could change the rounded result
+            return np.convolve(a.astype(np.int64), b.astype(np.int64))
+    elif min(len(a), len(b)) <= FFT_THRESHOLD:
+        return np.convolve(a, b)
+
+    nfft = 1 << (n - 1).bit_length()
+    if a.dtype.kind == 'c' or b.dtype.kind == 'c':
+        c = np.fft.ifft(np.fft.fft(a, nfft)*np.fft.fft(b, nfft))[:n]
+    else:
+        c = np.fft.irfft(np.fft.rfft(a, nfft)*np.fft.rfft(b, nfft), nfft)[:n]
+    if exact:
+        c = np.rint(c).astype(np.int64)
+    return c
+
+
 class Polynomial:
     """
-    class implementation of a polynomial, using a list to
+    class implementation of a polynomial, using a NumPy array to
     represent the polynomial coefficients.
     """
 
     def __init__(self, coefficients):
-        self.coeff = coefficients
+        self.coeff = np.array(coefficients)  # copy!
 
     def __call__(self, x):
+        # Horner's scheme: c0 + x*(c1 + x*(c2 + ...)), which
+        # avoids computing x**i for every term
+        coeff = self.coeff
+        if np.ndim(x) == 0:
+            # Python numbers, so integers are exact and never overflow
+            coeff = coeff.tolist()
         s = 0
-        for i in range(len(self.coeff)):
-            s += self.coeff[i]*x**i
+        for c in reversed(coeff):
+            s = s*x + c
         return s
 
+    def evaluate(self, x, chunk_size=2**20, out=None):
+        """
+        Evaluate the polynomial for an array of x values with
+        Horner's scheme. The array is processed in chunks of
+        chunk_size elements, so x and out may be memory-mapped
+        arrays (np.memmap) that are larger than the memory.
+        The result is float64, or complex128 if x or the
+        coefficients are complex.
+        """
+        x = np.asarray(x)
+        coeff = np.asarray(self.coeff)
+        dtype = np.result_type(x.dtype, coeff.dtype, np.float64)
+        if out is None:
+            out = np.empty(x.shape, dtype=dtype)
+        elif out.shape != x.shape or not out.flags.c_contiguous:
+            raise ValueError('out must be a contiguous array with '
+                             f'shape {x.shape}')
+        x_flat = x.reshape(-1)
+        out_flat = out.reshape(-1)
+        for start in range(0, x_flat.size, chunk_size):
+            xc = x_flat[start:start+chunk_size].astype(dtype, copy=False)
+            s = np.zeros(xc.shape, dtype=dtype)
+            for c in coeff[::-1]:
+                s *= xc
+                s += c
+            out_flat[start:start+chunk_size] = s
+        return out
+
     def __add__(self, other):
         # return self + other
 
-        # start with the longest list and add in the other:
-        if len(self.coeff) > len(other.coeff):
-            coeffsum = self.coeff[:]  # copy!
-            for i in range(len(other.coeff)):
-                coeffsum[i] += other.coeff[i]
-        else:
-            coeffsum = other.coeff[:] # copy!
-            for i in range(len(self.coeff)):
-                coeffsum[i] += self.coeff[i]
+        # start with zeros of the longest length and add in both:
+        a, b = self.coeff, other.coeff
+        coeffsum = np.zeros(max(len(a), len(b)), dtype=np.result_type(a, b))
+        coeffsum[:len(a)] += a
+        coeffsum[:len(b)] += b
         return Polynomial(coeffsum)
 
     def __mul__(self, other):
-        M = len(self.coeff) - 1
-        N = len(other.coeff) - 1
-        coeff = [0]*(M+N+1)  # or zeros(M+N+1)
-        for i in range(0, M+1):
-            for j in range(0, N+1):
-                coeff[i+j] += self.coeff[i]*other.coeff[j]
-        return Polynomial(coeff)
+        return Polynomial(convolve(self.coeff, other.coeff))
 
     def differentiate(self):
         #in-place differentiation, changes self,
-        for i in range(1, len(self.coeff)):
-            self.coeff[i-1] = i*self.coeff[i]
-        del self.coeff[-1]
+        n = len(self.coeff)
+        self.coeff = self.coeff[1:]*np.arange(1, n, dtype=self.coeff.dtype)
 
     def derivative(self):
         # returns new polynomial, does not change self
-        dpdx = Polynomial(self.coeff[:])  # copy
+        dpdx = Polynomial(self.coeff)  # copy
         dpdx.differentiate()
         return dpdx
 
@@ -78,6 +139,9 @@ if __name__ == '__main__':
 
     print(p3(2.0))
 
+    x = np.linspace(0, 2, 5)
+    print(p3.evaluate(x))
+
     p4 = p1*p2
     p2.differentiate()
     print(p2)
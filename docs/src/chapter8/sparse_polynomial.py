@@ -0,0 +1,126 @@
+"""
+Sparse polynomial class, based on the dict representation
+{power: coefficient} used in chapter 7 (poly_repr.py). The
+non-zero terms are stored in two sorted arrays, so all
+operations cost O(number of terms) instead of O(degree).
+"""
+import numpy as np
+from polynomial_class import Polynomial
+
+def combine_terms(powers, coeff):
+    """
+    Sort the terms by power, add coefficients of equal powers
+    and remove terms with zero coefficient.
+    """
+    order = np.argsort(powers, kind='stable')
+    powers = powers[order]
+    coeff = coeff[order]
+    if len(powers) == 0:
+        return powers, coeff
+    starts = np.flatnonzero(np.r_[True, powers[1:] != powers[:-1]])
+    powers = powers[starts]
+    coeff = np.add.reduceat(coeff, starts)
+    nonzero = coeff != 0
+    return powers[nonzero], coeff[nonzero]
+
+
+class SparsePolynomial:
+    """
+    class implementation of a sparse polynomial, using an array of
+    powers and an array of the corresponding non-zero coefficients.
+    """
+
+    def __init__(self, powers, coefficients):
+        powers = np.array(powers, dtype=np.int64)
+        coeff = np.array(coefficients)
+        if np.any(powers < 0):
+            raise ValueError('powers must be non-negative')
+        self.powers, self.coeff = combine_terms(powers, coeff)
+
+    @classmethod
+    def from_dict(cls, poly):
+        """Create from a dict {power: coefficient}."""
+        return cls(list(poly.keys()), list(poly.values()))
+
+    def to_dict(self):
+        return {int(p): c.item() for p, c in zip(self.powers, self.coeff)}
+
+    @classmethod
+    def from_dense(cls, poly):
+        """Create from an instance of the dense Polynomial class."""
+        powers = np.flatnonzero(poly.coeff)
+        return cls(powers, poly.coeff[powers])
+
+    def to_dense(self):
+        degree = self.powers[-1] if len(self.powers) > 0 else -1
+        coeff = np.zeros(degree + 1, dtype=self.coeff.dtype)
+        coeff[self.powers] = self.coeff
+        return Polynomial(coeff)
+
+    def __call__(self, x):
+        # Horner's scheme over the non-zero terms only:
+        # x**p0*(c0 + x**(p1-p0)*(c1 + x**(p2-p1)*(c2 + ...)))
+        # Python ints as powers, since x**np.int64 overflows for int x
+        p, c = self.powers.tolist(), self.coeff
+        if np.ndim(x) == 0:
+            c = c.tolist()    # exact for integer x, as in Polynomial
+        if len(p) == 0:
+            return 0*x
+        s = c[-1]
+        for k in range(len(p)-2, -1, -1):
+            s = s*x**(p[k+1] - p[k]) + c[k]
+        return s*x**p[0]
+
+    def __add__(self, other):
+        return SparsePolynomial(np.concatenate((self.powers, other.powers)),
+                                np.concatenate((self.coeff, other.coeff)))
+
+    def __mul__(self, other):
+        # all pairs of terms, equal powers are added by the constructor
+        powers = self.powers[:, np.newaxis] + other.powers[np.newaxis, :]
+        coeff = self.coeff[:, np.newaxis]*other.coeff[np.newaxis, :]
+        return SparsePolynomial(powers.ravel(), coeff.ravel())
+
+    def differentiate(self):
+        #in-place differentiation, changes self
+        nonconstant = self.powers > 0
+        self.coeff = self.coeff[nonconstant]*self.powers[nonconstant]
+        self.powers = self.powers[nonconstant] - 1
+
+    def derivative(self):
+        # returns new polynomial, does not change self
+        dpdx = SparsePolynomial(self.powers, self.coeff)  # copy
+        dpdx.differentiate()
+        return dpdx
+
+    def __str__(self):
+        s = ''
+        for p, c in zip(self.powers, self.coeff):
+            s += f' + {c:g}*x^{p:g}'
+        # fix layout (same special cases as in class Polynomial):
+        s = s.replace('+ -', '- ')
+        s = s.replace(' 1*', ' ')
+        s = s.replace('x^0', '1')
+        s = s.replace('x^1 ', 'x ')
+        if s[0:3] == ' + ':  # remove initial +
+            s = s[3:]
+        if s[0:3] == ' - ':  # fix spaces for initial -
+            s = '-' + s[3:]
+        return s
+
+
+if __name__ == '__main__':
+
+    # the polynomial from poly_repr.py in chapter 7
+    p1 = SparsePolynomial.from_dict({0: -1, 2: 1, 7: 3})
+    print(p1)
+    print(p1(2.5))   # same value as eval_poly_dict
+
+    p2 = SparsePolynomial([0, 3000], [1, -2])
+    p3 = p1*p2
+    print(p3)
+    print(p3.derivative())
+
+    x = np.linspace(0, 1, 5)
+    print(p3(x))
+    print(p3.to_dense()(x))
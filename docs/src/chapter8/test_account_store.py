@@ -0,0 +1,54 @@
+import numpy as np
+from account_store import AccountStore
+
+def test_add():
+    accounts = AccountStore(capacity=2)
+    accounts.add('Ola', 'Nordmann', ['1', '2', '3'], 100)
+    accounts.add('Liz', 'Olsson', '19371564761', 20000)
+    assert len(accounts) == 4
+    assert accounts.get_balance(['3', '1']).tolist() == [100, 100]
+    assert accounts['19371564761'].get_balance() == 20000
+    assert accounts._last_name[:4].tolist() == ['Nordmann']*3 + ['Olsson']
+    for names, balances in [(['Ola', 'Kari'], 0), ('Ola', [1, 2])]:
+        try:
+            accounts.add(names, 'Nordmann', ['4', '5', '6'], balances)
+        except ValueError:
+            pass
+        else:
+            assert False, 'length mismatch was accepted'
+    try:
+        accounts.add('Ola', 'Nordmann', ['4', '1'], 0)
+    except ValueError:
+        pass
+    else:
+        assert False, 'duplicate account number was accepted'
+    assert len(accounts) == 4
+
+def test_empty():
+    accounts = AccountStore()
+    assert accounts.rows([]).tolist() == []
+    try:
+        accounts.rows(['1'])
+    except KeyError:
+        pass
+    else:
+        assert False, 'unknown account in an empty store was accepted'
+
+def test_batch():
+    accounts = AccountStore()
+    accounts.add('Ola', 'Nordmann', ['1', '2', '3'], 0)
+    # repeated accounts get all their deposits
+    accounts.deposit(['1', '2', '1', '1'], np.array([1.0, 2.0, 3.0, 4.0]))
+    accounts.withdraw(['2', '2'], [1.0, 1.0])
+    assert accounts.get_balance(['1', '2', '3']).tolist() == [8, 0, 0]
+    try:
+        accounts.deposit(['1', '4'], [1.0, 1.0])
+    except KeyError:
+        pass
+    else:
+        assert False, 'unknown account was accepted'
+    assert accounts.get_balance(['1']).tolist() == [8]
+
+test_add()
+test_empty()
+test_batch()
@@ -0,0 +1,73 @@
+import os
+import random
+import struct
+import tempfile
+from account_protected import BankAccountP
+from account_transactions import TransactionEngine, read_ledger, replay
+
+def make_accounts(n=20, balance=1000):
+    return {str(1000 + i): BankAccountP('Ola', 'Nordmann', str(1000 + i),
+                                        balance)
+            for i in range(n)}
+
+def balances(accounts):
+    return {n: a.get_balance() for n, a in accounts.items()}
+
+def test_apply_batch_and_replay():
+    random.seed(1)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ledger_file = os.path.join(tmpdir, 'ledger.bin')
+        accounts = make_accounts()
+        engine = TransactionEngine(accounts, ledger_file, n_locks=4,
+                                   sync_every=100)
+        numbers = list(accounts)
+        transfers = [(random.choice(numbers), random.choice(numbers),
+                      random.randint(1, 100)) for i in range(5000)]
+        engine.apply_batch(transfers, max_workers=8)
+        engine.deposit('1000', 50)
+        engine.withdraw('1001', 20)
+        engine.close()
+        assert engine.transactions == len(read_ledger(ledger_file)) == 5002
+        # transfers between accounts keep the total balance
+        total = sum(balances(accounts).values())
+        assert total == 20*1000 + 50 - 20
+
+        restored = make_accounts()
+        replay(ledger_file, restored)
+        assert balances(restored) == balances(accounts)
+
+def test_failed_transfer():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ledger_file = os.path.join(tmpdir, 'ledger.bin')
+        accounts = make_accounts(2)
+        engine = TransactionEngine(accounts, ledger_file)
+        bad_transfers = [('1000', '3', 50),      # unknown account
+                         ('3', '1000', 50),
+                         (None, 'X1', 10),
+                         ('1000', '1001', 'abc')]  # bad amount
+        for src, dst, amount in bad_transfers:
+            try:
+                engine.transfer(src, dst, amount)
+            except (KeyError, struct.error):
+                pass
+            else:
+                assert False, f'transfer{(src, dst, amount)} was accepted'
+        engine.close()
+        assert balances(accounts) == {'1000': 1000, '1001': 1000}
+        assert engine.transactions == 0
+        assert os.path.getsize(ledger_file) == 0
+
+def test_account_numbers():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ledger_file = os.path.join(tmpdir, 'ledger.bin')
+        for number in '01', '0', 'X1', '-1', str(2**63):
+            try:
+                TransactionEngine({number: None}, ledger_file)
+            except ValueError:
+                pass
+            else:
+                assert False, f'account number {number!r} was accepted'
+
+test_apply_batch_and_replay()
+test_failed_transfer()
+test_account_numbers()
@@ -9,3 +9,43 @@ def test_Derivative():
     assert diff < 1E-14, 'bug in class Derivative, diff=%s' % diff
 
 test_Derivative()
+
+def test_Memoize():
+    from memoize import Memoize
+    calls = []
+    def f(x):
+        calls.append(x)
+        return x**2
+    g = Memoize(f, maxsize=2)
+    assert g(2.0) == 4.0 and g(2.0) == 4.0
+    assert (g.hits, g.misses) == (1, 1) and len(calls) == 1
+    # Derivative evaluates f(x) and f(x+h); f(x) comes from the cache
+    Derivative(g)(2.0)
+    assert (g.hits, g.misses) == (2, 2)
+    g(3.0)    # the cache is full, and the oldest value is removed
+    assert 2.0 not in g.cache
+
+test_Memoize()
+
+def test_AutoDerivative():
+    import numpy as np
+    from dual import AutoDerivative
+    f = lambda x: np.exp(-x)*np.sin(2*x) + x**3/(1 + x)
+    dfdx_exact = lambda x: np.exp(-x)*(2*np.cos(2*x) - np.sin(2*x)) + \
+                           (2*x**3 + 3*x**2)/(1 + x)**2
+    dfdx = AutoDerivative(f)
+    x = np.linspace(0, 2, 11)
+    diff = np.abs(dfdx(x) - dfdx_exact(x)).max()
+    assert diff < 1E-14, 'bug in class AutoDerivative, diff=%s' % diff
+    assert abs(dfdx(1.5) - dfdx_exact(1.5)) < 1E-14
+
+    # constant exponents, also where the derivative is zero or infinite
+    assert AutoDerivative(lambda x: x**0)(0.0) == 0
+    assert AutoDerivative(lambda x: x**0.5)(0.0) == np.inf
+    assert AutoDerivative(lambda x: x**2)(3.0) == 6.0
+    # negative exponents with an int x
+    assert AutoDerivative(lambda x: x**-1)(2) == -0.25
+    assert AutoDerivative(lambda x: x**-2)(np.array([1, 2])).tolist() == \
+        [-2.0, -0.25]
+
+test_AutoDerivative()
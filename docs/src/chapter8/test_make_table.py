@@ -0,0 +1,60 @@
+import io
+import os
+import tempfile
+from math import sin, exp
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from make_table import make_table, TextSink, FileSink, NpySink, MemmapSink
+
+def g(t):
+    # only works for numbers
+    return sin(t)*exp(-t)
+
+def test_sinks():
+    t = np.linspace(0, 2, 25)
+    for f in np.sin, g:
+        expected = np.column_stack((t, [f(t_) for t_ in t]))
+        out = io.StringIO()
+        make_table(f, 2, 25, TextSink(out, fmt='%.17g %.17g\n'),
+                   chunk_size=10)
+        out.seek(0)
+        assert np.array_equal(np.loadtxt(out), expected)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'table.txt')
+            make_table(f, 2, 25, FileSink(filename, fmt='%.17g %.17g\n'),
+                       chunk_size=10)
+            assert np.array_equal(np.loadtxt(filename), expected)
+            filename = os.path.join(tmpdir, 'table.npy')
+            make_table(f, 2, 25, NpySink(filename), chunk_size=10)
+            assert np.array_equal(np.load(filename), expected)
+            filename = os.path.join(tmpdir, 'table.bin')
+            make_table(f, 2, 25, MemmapSink(filename), chunk_size=10)
+            table = np.memmap(filename, dtype=float, mode='r').reshape(-1, 2)
+            assert np.array_equal(table, expected)
+            del table
+
+def test_executor():
+    t = np.linspace(0, 2, 25)
+    expected = np.column_stack((t, [g(t_) for t_ in t]))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, 'table.npy')
+        with ThreadPoolExecutor(2) as executor:
+            make_table(g, 2, 25, NpySink(filename), chunk_size=10,
+                       executor=executor)
+        assert np.array_equal(np.load(filename), expected)
+
+def test_one_point():
+    # t = tstart, as in np.linspace(tstart, tstop, 1)
+    out = io.StringIO()
+    make_table(lambda t: t**2, 5, 1, TextSink(out))
+    assert out.getvalue() == '0 0\n'
+    out = io.StringIO()
+    make_table(lambda t: t**2, 5, 1, TextSink(out), tstart=2)
+    assert out.getvalue() == '2 4\n'
+    out = io.StringIO()
+    make_table(np.sin, 5, 0, TextSink(out))
+    assert out.getvalue() == ''
+
+test_sinks()
+test_executor()
+test_one_point()
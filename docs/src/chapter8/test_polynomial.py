@@ -0,0 +1,64 @@
+import numpy as np
+from polynomial_class import Polynomial
+from sparse_polynomial import SparsePolynomial
+
+def test_evaluate():
+    p = Polynomial([1, -1, 0, 0, -6, -1])
+    x = np.linspace(-2, 2, 11)
+    expected = np.array([p(x_) for x_ in x])
+    # small chunk_size to test the chunked evaluation
+    diff = np.abs(p.evaluate(x, chunk_size=4) - expected).max()
+    assert diff < 1E-12, f'bug in Polynomial.evaluate, diff={diff}'
+
+    z = p.evaluate(x + 1j)
+    assert z.dtype == np.complex128
+    assert abs(z[3] - p(x[3] + 1j)) < 1E-12
+
+def test_call_int():
+    # integer coefficients and x give exact Python integers
+    p = Polynomial([1, 2, 3])
+    y = p(10**10)
+    assert type(y) is int and y == 300000000020000000001
+    assert p(2.0) == 17.0
+
+def test_mul():
+    # products computed with FFT should equal the direct convolution
+    rng = np.random.default_rng(1)
+    a = rng.integers(-100, 100, 1000)
+    b = rng.integers(-100, 100, 2000)
+    p = Polynomial(a)*Polynomial(b)
+    assert p.coeff.dtype == np.int64
+    assert np.array_equal(p.coeff, np.convolve(a, b))
+
+    q = Polynomial(a*0.5)*Polynomial(b*0.25)
+    diff = np.abs(q.coeff - np.convolve(a*0.5, b*0.25)).max()
+    assert diff < 1E-9, f'bug in FFT multiplication, diff={diff}'
+
+    # large integers are multiplied exactly
+    r = Polynomial([2**40, 1])*Polynomial([2**40, -1])
+    assert list(r.coeff) == [2**80, 0, -1]
+
+def test_sparse():
+    # sparse and dense polynomials should give the same results
+    p = SparsePolynomial.from_dict({0: -1, 2: 1, 7: 3})
+    q = SparsePolynomial([1, 7, 20], [2.0, -3.0, 0.5])
+    dense_p, dense_q = p.to_dense(), q.to_dense()
+    x = np.linspace(-1, 1, 7)
+    for sparse, dense in [(p + q, dense_p + dense_q),
+                          (p*q, dense_p*dense_q),
+                          (p.derivative(), dense_p.derivative())]:
+        diff = np.abs(sparse(x) - dense(x)).max()
+        assert diff < 1E-12, f'bug in SparsePolynomial, diff={diff}'
+    assert (p + SparsePolynomial([7], [-3])).to_dict() == {0: -1, 2: 1}
+    assert SparsePolynomial.from_dense(dense_q).to_dict() == q.to_dict()
+
+    # integer x and high powers must not overflow
+    r = SparsePolynomial([0, 70], [1, 1])
+    assert r(2) == 2**70 + 1
+    assert r(2.0) == 2.0**70 + 1
+    assert p(3) == dense_p(3)
+
+test_evaluate()
+test_mul()
+test_call_int()
+test_sparse()
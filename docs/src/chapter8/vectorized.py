@@ -0,0 +1,24 @@
+"""
+Test if a function works with arrays. Derivative, Memoize and
+make_table call f once with an array of points if f is vectorized,
+and otherwise fall back to one call per point.
+"""
+import numpy as np
+
+def is_vectorized(f, x):
+    """
+    Return f(x) as an array if f handles the array x, that is, if
+    f(x) does not raise TypeError or ValueError and has the same
+    shape as x. Otherwise, return None.
+    """
+    try:
+        y = np.asarray(f(x))
+    except (TypeError, ValueError):
+        return None    # f only accepts numbers
+    return y if y.shape == np.shape(x) else None
+
+
+if __name__ == '__main__':
+    from math import sin
+    x = np.linspace(0, 1, 3)
+    print(is_vectorized(np.sin, x), is_vectorized(sin, x))
@@ -4,23 +4,72 @@ where the Parabola class is a subclass of Line and
 inherits as much as possible from that class.
 """
 
+import os
 import numpy as np
 
-class Line:
+def linspace_chunks(L, R, n, chunk_size):
+    """
+    Yield np.linspace(L, R, n) in chunks of (at most) chunk_size
+    points, without creating the whole array.
+    """
+    h = (R - L)/(n - 1) if n > 1 else 0
+    for start in range(0, n, chunk_size):
+        x = L + h*np.arange(start, min(start + chunk_size, n))
+        if n > 1 and start + len(x) == n:
+            x[-1] = R     # exact endpoint, as in np.linspace
+        yield x
+
+class Table:
+    """
+    Table methods for a class with a vectorized __call__, used by
+    Line and Parabola here and in line_parabola_v2.
+    """
+    def table(self, L, R, n):
+        """Return a table with n points for L <= x <= R."""
+        return ''.join(self.table_chunks(L, R, n))
+
+    def xy_chunks(self, L, R, n, chunk_size=100000):
+        """
+        Yield arrays x, y for n points L <= x <= R, chunk_size points
+        at a time. x is the same as np.linspace(L, R, n), but only one
+        chunk is in memory at a time.
+        """
+        for x in linspace_chunks(L, R, n, chunk_size):
+            yield x, self(x)
+
+    def table_chunks(self, L, R, n, chunk_size=100000, fmt='%12g %12g\n'):
+        """Yield the table as strings of (at most) chunk_size rows."""
+        for x, y in self.xy_chunks(L, R, n, chunk_size):
+            # one formatting operation for the whole chunk
+            yield (fmt*len(x)) % tuple(np.column_stack((x, y)).ravel())
+
+    def write_table(self, outfile, L, R, n, format='txt', chunk_size=100000):
+        """
+        Write the table to an open file, chunk by chunk. format is
+        'txt' (as from table), 'csv', or 'binary' (x, y as pairs of
+        float64 numbers; outfile must then be opened in binary mode).
+        """
+        if format == 'binary':
+            for x, y in self.xy_chunks(L, R, n, chunk_size):
+                outfile.write(np.column_stack((x, y)).astype('<f8').tobytes())
+            return
+        if format == 'csv':
+            outfile.write('x,y\n')
+            fmt = '%.17g,%.17g\n'
+        elif format == 'txt':
+            fmt = '%12g %12g\n'
+        else:
+            raise ValueError(f'unknown table format {format}')
+        for chunk in self.table_chunks(L, R, n, chunk_size, fmt):
+            outfile.write(chunk)
+
+class Line(Table):
     def __init__(self, c0, c1):
         self.c0, self.c1 = c0, c1
 
     def __call__(self, x):
         return self.c0 + self.c1*x
 
-    def table(self, L, R, n):
-        """Return a table with n points for L <= x <= R."""
-        s = ''
-        for x in np.linspace(L, R, n):
-            y = self(x)
-            s += f'{x:12g} {y:12g}\n'
-        return s
-
 #let Parabola inhherit from Line
 class Parabola(Line):
     def __init__(self, c0, c1, c2):
@@ -38,6 +87,11 @@ if __name__ == '__main__':
     print(p1)
     print(p.table(0, 1, 3))
 
+    #large tables are written to file in chunks:
+    with open('table.csv', 'w') as outfile:
+        p.write_table(outfile, 0, 1, 10**4, format='csv')
+    os.remove('table.csv')
+
     """
     We can use the function isinstance (True/False) to check whether
     an object is an instance of a given class. Here we use
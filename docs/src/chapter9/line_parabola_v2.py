@@ -6,23 +6,15 @@ is a special case of a parabola, and a subclass
 is usually thought of as a special case of its
 baseclass.
 """
-import numpy as np
+from line_parabola_v1 import Table
 
-class Parabola:
+class Parabola(Table):
     def __init__(self, c0, c1, c2):
         self.c0, self.c1, self.c2 = c0, c1, c2
 
     def __call__(self, x):
         return self.c2*x**2 + self.c1*x + self.c0
 
-    def table(self, L, R, n):
-        """Return a table with n points for L <= x <= R."""
-        s = ''
-        for x in linspace(L, R, n):
-            y = self(x)
-            s += '%12g %12g\n' % (x, y)
-        return s
-
 class Line(Parabola):
     def __init__(self, c0, c1):
         super().__init__(c0, c1, 0)
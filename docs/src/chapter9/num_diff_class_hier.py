@@ -1,23 +1,42 @@
+import numpy as np
+
 class Diff:
+    """
+    Base class for finite difference formulas. A subclass defines
+    the stencil offsets (in units of h) and weights, such that
+    f'(x) is approximated by sum(weights[i]*f(x + offsets[i]*h))/h.
+    x can be a number or an array. All stencil points are stacked
+    in one array of shape (len(offsets),) + x.shape, so a vectorized
+    f is only called once.
+    """
+    offsets = None
+    weights = None
+
     def __init__(self, f, h=1E-5):
         self.f, self.h = f, h
 
-class Forward1(Diff):
     def __call__(self, x):
         f, h = self.f, self.h
-        return (f(x+h) - f(x))/h
+        points = np.add.outer(np.asarray(self.offsets)*h, x)
+        try:
+            values = np.asarray(f(points))
+        except (TypeError, ValueError):
+            values = None     # f does not accept arrays
+        if values is None or values.shape != points.shape:
+            values = np.vectorize(f, otypes=[float])(points)
+        return (np.tensordot(self.weights, values, axes=1)/h)[()]
+
+class Forward1(Diff):
+    offsets = [0, 1]
+    weights = [-1, 1]
 
 class Central2(Diff):
-    def __call__(self,x):
-        f, h = self.f, self.h
-        return (f(x+h)-f(x-h))/(2*h)
+    offsets = [-1, 1]
+    weights = [-1./2, 1./2]
 
 class Central4(Diff):
-    def __call__(self, x):
-        f, h = self.f, self.h
-        return (4./3)*(f(x+h)   - f(x-h))  /(2*h) - \
-               (1./3)*(f(x+2*h) - f(x-2*h))/(4*h)
-
+    offsets = [-2, -1, 1, 2]
+    weights = [1./12, -2./3, 2./3, -1./12]
 
 if __name__ == '__main__':
 
@@ -35,3 +54,8 @@ if __name__ == '__main__':
         e2 = abs(c2(pi/4)-ref)
         e4 = abs(c4(pi/4)-ref)
         print(f'{h_:1.8f}  {e1:1.10f}  {e2:>1.10f}  {e4:>1.10f}')
+
+    # all derivatives on a grid, with one call to the vectorized np.sin:
+    x = np.linspace(0, pi, 1001)
+    c4 = Central4(np.sin, 1E-3)
+    print(f'Max error on grid: {abs(c4(x) - np.cos(x)).max():g}')
@@ -1,15 +1,81 @@
+import math
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 
+def evaluate(f, x):
+    """
+    Return f(x) for all points in the array x. A vectorized f
+    is called once with the whole array, while functions that
+    only accept scalar arguments are called for one point at a time.
+    """
+    try:
+        y = np.asarray(f(x))
+    except (TypeError, ValueError):
+        # e.g. math.sin(x) or 'if x > 0:' with an array x
+        y = None
+    if y is None or y.shape != x.shape:
+        y = np.array([f(xi) for xi in x])
+    return y
+
+def partial_sum(f, x, w):
+    """Return the sum of w[i]*f(x[i]), calling f for one point at a time."""
+    s = 0
+    for xi, wi in zip(x, w):
+        s += wi*f(xi)
+    return s
+
+# shared rules, (class, parameters) -> (points, weights, n),
+# with the least recently used rule removed first
+rule_cache = OrderedDict()
+rule_cache_size = 128
+
 class Integrator:
+    # the attributes that determine points and weights of the rule;
+    # None means that the rules of the class are not cached. A
+    # subclass with more parameters adds them to cache_key.
+    cache_key = None
+
     def __init__(self, a, b, n):
         self.a, self.b, self.n = a, b, n
-        self.points, self.weights = self.construct_method()
+        self.points, self.weights = self.cached_method()
+
+    def cached_method(self):
+        """
+        Return the points and weights from construct_method, such
+        that integrators with the same class and cache_key attributes
+        share the same arrays. The arrays are made read-only since
+        they are shared. Unhashable parameters (e.g. arrays) are
+        not cached.
+        """
+        if self.cache_key is None:
+            return self.construct_method()
+        key = (type(self),) + tuple(getattr(self, name)
+                                    for name in self.cache_key)
+        try:
+            hash(key)
+        except TypeError:
+            return self.construct_method()
+        if key in rule_cache:
+            rule_cache.move_to_end(key)
+        else:
+            x, w = self.construct_method()
+            x.flags.writeable = False
+            w.flags.writeable = False
+            rule_cache[key] = x, w, self.n  # construct_method may adjust n
+            if len(rule_cache) > rule_cache_size:
+                rule_cache.popitem(last=False)
+        x, w, self.n = rule_cache[key]
+        return x, w
 
     def construct_method(self):
         raise NotImplementedError('no rule in class %s' % \
                                   self.__class__.__name__)
 
     def integrate(self, f):
+        return np.dot(self.weights, evaluate(f, self.points))
+
+    def scalar_integrate(self, f):
         s = 0
         for i in range(len(self.weights)):
             s += self.weights[i]*f(self.points[i])
@@ -17,9 +83,65 @@ class Integrator:
 
     def vectorized_integrate(self, f):
         # f must be vectorized for this to work
-        return dot(self.weights, f(self.points))
+        return np.dot(self.weights, f(self.points))
+
+    def parallel_integrate(self, f, executor=None, max_workers=None,
+                           chunk_size=1000):
+        """
+        Integrate an expensive scalar function f in parallel. The
+        points are split into chunks of chunk_size points, and the
+        weighted sums of the chunks are computed by executor, which
+        by default is a ProcessPoolExecutor with max_workers
+        processes (f must then be picklable). The chunks do not
+        depend on the number of workers, and the partial sums are
+        added with math.fsum, so the result is the same for any
+        number of workers.
+        """
+        starts = range(0, len(self.points), chunk_size)
+        x = [self.points[i:i+chunk_size] for i in starts]
+        w = [self.weights[i:i+chunk_size] for i in starts]
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(max_workers)
+        try:
+            sums = list(executor.map(partial_sum, [f]*len(x), x, w))
+        finally:
+            if own_executor:
+                executor.shutdown()
+        return math.fsum(sums)
+
+    def integrate_many(self, f):
+        """
+        Integrate many integrands over [a, b] as one matrix-vector
+        product. f is either a list of functions, or a vectorized
+        function returning an array of shape (k, n) for the n points.
+        Returns an array with the k integrals.
+        """
+        if callable(f):
+            y = np.asarray(f(self.points))
+        else:
+            y = np.array([evaluate(fi, self.points) for fi in f])
+        return y @ self.weights
+
+    @classmethod
+    def integrate_intervals(cls, f, a, b, n):
+        """
+        Integrate f over the intervals [a[k], b[k]], k = 0, ..., K-1,
+        using the rule with n points on each interval. The rule is
+        constructed once on [0, 1] and scaled to all the intervals.
+        Returns an array with the K integrals.
+        """
+        rule = cls(0.0, 1.0, n)
+        x, w = rule.points, rule.weights
+        a = np.asarray(a, dtype=float)[..., np.newaxis]
+        b = np.asarray(b, dtype=float)[..., np.newaxis]
+        points = a + (b - a)*x          # shape (K, n)
+        y = evaluate(f, points.ravel()).reshape(points.shape)
+        return (y @ w)*(b - a)[..., 0]
 
 class Trapezoidal(Integrator):
+    cache_key = ('a', 'b', 'n')
+
     def construct_method(self):
         h = (self.b - self.a)/float(self.n - 1)
         x = np.linspace(self.a, self.b, self.n)
@@ -28,7 +150,33 @@ class Trapezoidal(Integrator):
         w[0] = h/2;  w[-1] = h/2
         return x, w
 
+    def romberg(self, f, tol=1E-10, max_levels=20):
+        """
+        Romberg integration: start with the trapezoidal rule on the
+        grid of self, then repeatedly halve h, so that only the new
+        midpoints must be evaluated, and improve the results with
+        Richardson extrapolation until two successive estimates
+        differ by less than tol.
+        """
+        h = (self.b - self.a)/float(self.n - 1)
+        R = [[self.integrate(f)]]   # R[k][j]: level k, j extrapolations
+        self.evaluations = self.n
+        for k in range(1, max_levels + 1):
+            n_mid = (self.n - 1)*2**(k - 1)
+            midpoints = self.a + h*(np.arange(n_mid) + 0.5)
+            self.evaluations += n_mid
+            row = [R[-1][0]/2 + h/2*np.sum(evaluate(f, midpoints))]
+            for j in range(1, k + 1):
+                row.append(row[j-1] + (row[j-1] - R[-1][j-1])/(4**j - 1))
+            R.append(row)
+            h /= 2
+            if abs(R[-1][-1] - R[-2][-1]) < tol:
+                break
+        return R[-1][-1]
+
 class Midpoint(Integrator):
+    cache_key = ('a', 'b', 'n')
+
     def construct_method(self):
         a, b, n = self.a, self.b, self.n  # quick forms
         h = (b-a)/float(n)
@@ -37,6 +185,8 @@ class Midpoint(Integrator):
         return x, w
 
 class Simpson(Integrator):
+    cache_key = ('a', 'b', 'n')
+
     def construct_method(self):
         if self.n % 2 != 1:
             print(f'n={self.n} must be odd, 1 is added')
@@ -51,6 +201,60 @@ class Simpson(Integrator):
         return x, w
 
 
+class AdaptiveSimpson(Integrator):
+    """
+    Adaptive Simpson's rule. Intervals are halved only where the
+    local error estimate exceeds the tolerance, and the function
+    values at the ends and midpoints of an interval are reused
+    when it is refined. All intervals on the same level are refined
+    together, so a vectorized f is called once per level.
+    """
+    def __init__(self, a, b, tol=1E-8, max_depth=50):
+        self.tol, self.max_depth = tol, max_depth
+        super().__init__(a, b, 3)
+
+    def construct_method(self):
+        # Simpson's rule on the whole interval, the starting point
+        x = np.linspace(self.a, self.b, 3)
+        w = (self.b - self.a)/6*np.array([1.0, 4.0, 1.0])
+        return x, w
+
+    def integrate(self, f):
+        fa, fm, fb = evaluate(f, self.points)
+        self.evaluations = 3
+        a = np.array([self.a], dtype=float)
+        b = np.array([self.b], dtype=float)
+        fa, fm, fb = np.array([fa]), np.array([fm]), np.array([fb])
+        whole = self.weights @ np.array([fa[0], fm[0], fb[0]])
+        whole = np.array([whole])
+        tol = np.array([self.tol])
+
+        s = 0
+        for depth in range(self.max_depth + 1):
+            m = (a + b)/2
+            f_new = evaluate(f, np.concatenate(((a + m)/2, (m + b)/2)))
+            self.evaluations += len(f_new)
+            flm, frm = f_new[:len(a)], f_new[len(a):]
+            left = (m - a)/6*(fa + 4*flm + fm)
+            right = (b - m)/6*(fm + 4*frm + fb)
+            delta = left + right - whole
+            done = np.abs(delta) <= 15*tol
+            if depth == self.max_depth:
+                done[:] = True
+            # Richardson extrapolation of the accepted intervals
+            s += np.sum((left + right + delta/15)[done])
+            if done.all():
+                break
+            r = ~done  # refine these intervals, reusing f values
+            a, b = np.concatenate((a[r], m[r])), np.concatenate((m[r], b[r]))
+            fa, fm, fb = (np.concatenate((fa[r], fm[r])),
+                          np.concatenate((flm[r], frm[r])),
+                          np.concatenate((fm[r], fb[r])))
+            whole = np.concatenate((left[r], right[r]))
+            tol = np.concatenate((tol[r], tol[r]))/2
+        return s
+
+
 if __name__ == '__main__':
     def f(x):
         return x*x
@@ -59,3 +263,24 @@ if __name__ == '__main__':
     print(simpson.integrate(f))
     trapez = Trapezoidal(0,2,101)
     print(trapez.integrate(f))
+
+    from math import sin
+    # a scalar function is also handled; the points and weights
+    # are reused from the first Simpson instance
+    simpson2 = Simpson(0, 2, 101)
+    print(simpson2.integrate(sin), simpson2.points is simpson.points)
+
+    # expensive scalar functions can be integrated in parallel
+    print(simpson2.parallel_integrate(sin, max_workers=4, chunk_size=10))
+
+    # integrate x**k for k = 0, 1, 2, 3 in one call:
+    k = np.arange(4)[:, np.newaxis]
+    print(simpson.integrate_many(lambda x: x**k))
+    # and x**2 over the intervals [0, 1], [0, 2], [1, 3]:
+    print(Simpson.integrate_intervals(f, [0, 0, 1], [1, 2, 3], 101))
+
+    romberg = Trapezoidal(0, 2, 3)
+    print(romberg.romberg(np.exp), romberg.evaluations, np.exp(2) - 1)
+
+    adaptive = AdaptiveSimpson(0, 2, tol=1E-10)
+    print(adaptive.integrate(np.sqrt), adaptive.evaluations)
@@ -0,0 +1,50 @@
+import io
+import numpy as np
+import line_parabola_v1
+import line_parabola_v2
+
+def old_table(f, L, R, n):
+    # the table method before it was vectorized
+    s = ''
+    for x in np.linspace(L, R, n):
+        y = f(x)
+        s += f'{x:12g} {y:12g}\n'
+    return s
+
+def test_table():
+    for module in line_parabola_v1, line_parabola_v2:
+        for f in module.Line(-1, 1), module.Parabola(1, -2, 2):
+            for n in 0, 1, 2, 11, 250:
+                expected = old_table(f, -1, 2, n)
+                assert f.table(-1, 2, n) == expected, (module, n)
+                out = io.StringIO()
+                f.write_table(out, -1, 2, n, chunk_size=7)
+                assert out.getvalue() == expected, (module, n)
+            # one point is x = L, as in np.linspace(L, R, 1)
+            assert f.table(5, 7, 1) == f'{5:12g} {f(5):12g}\n'
+
+def test_write_table():
+    p = line_parabola_v1.Parabola(1, -2, 2)
+    x = np.linspace(0, 1, 101)
+    out = io.StringIO()
+    p.write_table(out, 0, 1, 101, format='csv', chunk_size=10)
+    out.seek(0)
+    assert out.readline() == 'x,y\n'
+    data = np.loadtxt(out, delimiter=',')
+    # %.17g keeps all digits
+    assert np.array_equal(data, np.column_stack((x, p(x))))
+
+    out = io.BytesIO()
+    p.write_table(out, 0, 1, 101, format='binary', chunk_size=10)
+    data = np.frombuffer(out.getvalue(), dtype='<f8').reshape(-1, 2)
+    assert np.array_equal(data, np.column_stack((x, p(x))))
+
+    try:
+        p.write_table(io.StringIO(), 0, 1, 3, format='xml')
+    except ValueError:
+        pass
+    else:
+        assert False, 'unknown format was accepted'
+
+test_table()
+test_write_table()
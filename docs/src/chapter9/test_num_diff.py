@@ -0,0 +1,39 @@
+from math import sin, cos
+import numpy as np
+from num_diff_class_hier import Forward1, Central2, Central4
+
+# the formulas as they were written before the stencil version
+formulas = {
+    Forward1: lambda f, x, h: (f(x+h) - f(x))/h,
+    Central2: lambda f, x, h: (f(x+h) - f(x-h))/(2*h),
+    Central4: lambda f, x, h: (4./3)*(f(x+h) - f(x-h))/(2*h) -
+                              (1./3)*(f(x+2*h) - f(x-2*h))/(4*h),
+}
+
+def test_Diff_arrays():
+    x = np.linspace(0, 2, 21)
+    h = 1E-3
+    for method, formula in formulas.items():
+        calls = []
+        def f(x):
+            calls.append(x)
+            return np.sin(x)
+        df = method(f, h)(x)
+        assert df.shape == x.shape
+        assert len(calls) == 1, 'f should be called once'
+        diff = np.abs(df - formula(np.sin, x, h)).max()
+        assert diff < 1E-10, f'bug in {method.__name__}, diff={diff}'
+
+def test_Diff_scalar():
+    # scalar-only f, for a number and for an array of x values
+    h = 1E-3
+    for method, formula in formulas.items():
+        df = method(sin, h)
+        assert abs(df(0.5) - formula(sin, 0.5, h)) < 1E-10
+        x = np.linspace(0, 2, 5)
+        expected = [formula(sin, x_, h) for x_ in x]
+        assert np.abs(df(x) - expected).max() < 1E-10
+        assert abs(df(0.5) - cos(0.5)) < 1E-2
+
+test_Diff_arrays()
+test_Diff_scalar()
@@ -0,0 +1,104 @@
+from math import sin, cos, sqrt
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from num_int_class_hier import Integrator, Trapezoidal, Midpoint, Simpson, \
+     AdaptiveSimpson
+
+def test_integrate():
+    # vectorized and scalar functions should give the same result
+    exact = 1 - cos(2)
+    for method in Trapezoidal, Midpoint, Simpson:
+        integrator = method(0, 2, 1001)
+        I_vec = integrator.integrate(np.sin)
+        I_scalar = integrator.integrate(sin)
+        assert abs(I_vec - I_scalar) < 1E-12
+        assert abs(I_vec - exact) < 1E-5, f'bug in {method.__name__}'
+
+    # identical rules share the cached points and weights
+    assert Simpson(0, 2, 1001).weights is Simpson(0, 2, 1001).weights
+    # array limits cannot be cached, but still work
+    I = Simpson(np.array(0.0), np.array(2.0), 1001).integrate(np.sin)
+    assert abs(I - exact) < 1E-5
+
+class NewtonCotes(Integrator):
+    # a subclass with its own parameter in construct_method
+    cache_key = ('a', 'b', 'n', 'order')
+
+    def __init__(self, a, b, n, order=1):
+        self.order = order
+        super().__init__(a, b, n)
+
+    def construct_method(self):
+        rule = Trapezoidal if self.order == 1 else Simpson
+        r = rule(self.a, self.b, self.n)
+        return r.points.copy(), r.weights.copy()
+
+def test_subclass():
+    trapez = NewtonCotes(0, 2, 101, order=1)
+    simpson = NewtonCotes(0, 2, 101, order=2)
+    assert trapez.weights is not simpson.weights
+    assert abs(trapez.integrate(np.sin) -
+               Trapezoidal(0, 2, 101).integrate(np.sin)) < 1E-14
+    assert abs(simpson.integrate(np.sin) -
+               Simpson(0, 2, 101).integrate(np.sin)) < 1E-14
+    assert NewtonCotes(0, 2, 101, order=2).weights is simpson.weights
+
+def test_batched():
+    simpson = Simpson(0, 2, 101)
+    I = simpson.integrate_many([np.sin, np.cos, lambda x: x**2])
+    expected = [simpson.integrate(np.sin), simpson.integrate(np.cos),
+                simpson.integrate(lambda x: x**2)]
+    assert np.abs(I - expected).max() < 1E-12
+
+    a = np.linspace(0, 1, 50)
+    b = a + np.linspace(0.5, 2, 50)
+    for method in Trapezoidal, Midpoint, Simpson:
+        I = method.integrate_intervals(np.sin, a, b, 101)
+        expected = [method(a_, b_, 101).integrate(np.sin)
+                    for a_, b_ in zip(a, b)]
+        assert np.abs(I - expected).max() < 1E-12, \
+               f'bug in {method.__name__}.integrate_intervals'
+
+def test_adaptive():
+    exact = 2/3*2**1.5
+    results = []
+    for f in np.sqrt, sqrt:  # vectorized and scalar-only f
+        adaptive = AdaptiveSimpson(0, 2, tol=1E-8)
+        results.append((adaptive.integrate(f), adaptive.evaluations))
+        diff = abs(results[-1][0] - exact)
+        assert diff < 1E-8, f'bug in AdaptiveSimpson, diff={diff}'
+    assert results[0] == results[1]
+
+    # uniform Simpson needs more evaluations for the same accuracy
+    error = abs(results[0][0] - exact)
+    n = 3
+    while abs(Simpson(0, 2, n).integrate(np.sqrt) - exact) > error:
+        n = 2*n - 1
+    assert adaptive.evaluations < n/10, (adaptive.evaluations, n)
+
+def test_romberg():
+    exact = 1 - cos(3)
+    for f in np.sin, sin:
+        trapez = Trapezoidal(0, 3, 2)
+        diff = abs(trapez.romberg(f, tol=1E-12) - exact)
+        assert diff < 1E-12, f'bug in Trapezoidal.romberg, diff={diff}'
+        # every level reuses the previous points: 2**k + 1 evaluations
+        n = trapez.evaluations - 1
+        assert n & (n - 1) == 0
+
+def test_parallel():
+    simpson = Simpson(0, 2, 1001)
+    I = simpson.parallel_integrate(sin, max_workers=2, chunk_size=100)
+    assert abs(I - simpson.integrate(sin)) < 1E-12
+    # the result does not depend on the number of workers
+    for workers in 1, 3, 8:
+        with ThreadPoolExecutor(workers) as executor:
+            I_w = simpson.parallel_integrate(sin, executor, chunk_size=100)
+        assert I_w == I
+
+test_integrate()
+test_subclass()
+test_batched()
+test_adaptive()
+test_romberg()
+test_parallel()